@@ -0,0 +1,77 @@
+"""Date -> round lookups over years of rounds: RoundIndex against a linear scan.
+
+Run with ``python benchmarks/round_index.py``. Importing wordlinator reads
+the rounds table, so the usual ``DB_*`` environment is needed.
+"""
+import argparse
+import dataclasses
+import datetime
+import random
+import timeit
+
+import wordlinator.utils
+
+ROUND_DAYS = 18
+
+
+@dataclasses.dataclass
+class _Round:
+    game: int
+    start_date: datetime.date
+
+    @property
+    def end_date(self):
+        return self.start_date + datetime.timedelta(days=ROUND_DAYS - 1)
+
+
+def _linear_find(rounds, date):
+    # GolfHole.from_date before the index.
+    for round in rounds:
+        if round.start_date <= date <= round.end_date:
+            return round
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser("round-index-benchmark")
+    parser.add_argument("--years", type=int, nargs="+", default=[1, 5, 20])
+    parser.add_argument("--lookups", type=int, default=100_000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    start = wordlinator.utils.WORDLE_DAY_ZERO
+    for years in args.years:
+        # Back to back rounds, as they are scheduled.
+        rounds = [
+            _Round(
+                game=n + 1, start_date=start + datetime.timedelta(days=n * ROUND_DAYS)
+            )
+            for n in range(years * 365 // ROUND_DAYS)
+        ]
+        index = wordlinator.utils.RoundIndex(rounds)
+        dates = [
+            start + datetime.timedelta(days=rng.randrange(years * 365))
+            for _ in range(args.lookups)
+        ]
+        assert all(index.find(d) is _linear_find(rounds, d) for d in dates[:1000])
+
+        linear = timeit.timeit(
+            lambda: [_linear_find(rounds, d) for d in dates], number=1
+        )
+        indexed = timeit.timeit(lambda: [index.find(d) for d in dates], number=1)
+        print(
+            f"{years:>3} years, {len(rounds):>4} rounds: "
+            f"linear {linear / args.lookups * 1e6:.2f}us, "
+            f"indexed {indexed / args.lookups * 1e6:.2f}us per lookup"
+        )
+
+    wordle_nos = [rng.randrange(365 * 2) for _ in range(args.lookups)]
+    cached = timeit.timeit(
+        lambda: [wordlinator.utils.WordleDay.from_wordle_no(n) for n in wordle_nos],
+        number=1,
+    )
+    print(f"WordleDay.from_wordle_no: {cached / args.lookups * 1e6:.2f}us per call")
+
+
+if __name__ == "__main__":
+    main()
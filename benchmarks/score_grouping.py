@@ -0,0 +1,105 @@
+"""Score grouping for a dashboard render: one group_by pass against dict_by passes.
+
+Run with ``python benchmarks/score_grouping.py``. Importing wordlinator
+reads the rounds table, so the usual ``DB_*`` environment is needed. The
+scores are unsaved models, so nothing else touches the database.
+"""
+import argparse
+import random
+import timeit
+import types
+
+import wordlinator.db.pg as db
+import wordlinator.utils.scores
+
+HOLES = 18
+
+
+def _scores(user_count, missing, seed=0):
+    rng = random.Random(seed)
+    game = db.Game(game_id=1, game=1)
+    holes = [db.Hole(hole_id=h, hole=h, game_id=game) for h in range(1, HOLES + 1)]
+    users = [db.User(user_id=i, username=f"player{i}") for i in range(user_count)]
+    scores = [
+        db.Score(
+            score=rng.randint(1, 7),
+            user_id=user,
+            hole_id=hole,
+            game_id=game,
+            tweet_id=rng.choice([None, f"{rng.randrange(10 ** 18)}"]),
+        )
+        for user in users
+        for hole in holes
+        if rng.random() >= missing
+    ]
+    rng.shuffle(scores)
+    return scores, [u.username for u in users]
+
+
+def _dict_by(scores, attribute_path):
+    # ScoreContainer.dict_by before group_by: split the path, getattr per part.
+    data_dict = {}
+    path_parts = attribute_path.split(".")
+    for score in scores:
+        attribute = score
+        for path_part in path_parts:
+            attribute = getattr(attribute, path_part)
+        data_dict.setdefault(attribute, []).append(score)
+    return data_dict
+
+
+def _old_groupings(scores):
+    # A render's groupings as they were built: by user for the rows, by hole
+    # for the summary rows, and by score, then each score's bucket by hole,
+    # for the breakdown.
+    _dict_by(scores, "user_id.username")
+    _dict_by(scores, "hole_id.hole")
+    for bucket in _dict_by(scores, "score").values():
+        _dict_by(bucket, "hole_id.hole")
+
+
+def _new_groupings(scores):
+    wordlinator.utils.scores.ScoreContainer(scores).group_by(
+        "user_id.username", "hole_id.hole", "score", ("score", "hole_id.hole")
+    )
+
+
+def _render(scores, usernames, wordle_day):
+    # The matrix calls behind the leaderboard, stats, race and user-scores tabs.
+    matrix = wordlinator.utils.scores.ScoreMatrix(scores, usernames=usernames)
+    matrix.golf_scores()
+    matrix.score_breakdown()
+    matrix.hole_counts()
+    matrix.hole_averages()
+    matrix.top_by_day()
+    matrix.user_rows(wordle_day, categories=True)
+    matrix.by_user()
+    matrix.by_hole()
+
+
+def main():
+    parser = argparse.ArgumentParser("score-grouping-benchmark")
+    parser.add_argument("--users", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--missing", type=float, default=0.1)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    wordle_day = types.SimpleNamespace(golf_hole=types.SimpleNamespace(hole_no=HOLES))
+    for user_count in args.users:
+        scores, usernames = _scores(user_count, args.missing)
+        timings = {
+            name: min(timeit.repeat(run, number=1, repeat=args.repeat)) * 1000
+            for name, run in (
+                ("dict_by passes", lambda: _old_groupings(scores)),
+                ("group_by pass", lambda: _new_groupings(scores)),
+                ("full render", lambda: _render(scores, usernames, wordle_day)),
+            )
+        }
+        print(
+            f"{user_count:>5} players, {len(scores):>6} scores: "
+            + ", ".join(f"{name} {ms:.1f}ms" for name, ms in timings.items())
+        )
+
+
+if __name__ == "__main__":
+    main()
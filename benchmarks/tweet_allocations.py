@@ -0,0 +1,162 @@
+"""Memory held by parsed tweet batches, slotted value types against the old ones.
+
+Run with ``python benchmarks/tweet_allocations.py``. Importing wordlinator
+reads the rounds table, so the usual ``DB_*`` environment is needed.
+"""
+import argparse
+import dataclasses
+import datetime
+import random
+import timeit
+import tracemalloc
+import typing
+
+import dateutil.parser
+
+import wordlinator.twitter
+import wordlinator.utils
+
+BATCH_SIZE = 100
+
+
+# The value types and parsing as they were before they were slotted.
+@dataclasses.dataclass
+class _OldGolfHole:
+    game_no: int
+    hole_no: int
+
+
+@dataclasses.dataclass
+class _OldWordleDay:
+    wordle_no: int
+    date: datetime.date
+    golf_hole: typing.Optional[_OldGolfHole]
+
+    @classmethod
+    def from_wordle_no(cls, wordle_no):
+        date = wordlinator.utils.WORDLE_DAY_ZERO + datetime.timedelta(days=wordle_no)
+        golf_hole = None
+        for round in wordlinator.utils.WORDLE_GOLF_ROUNDS:
+            if round.start_date <= date <= round.end_date:
+                hole_no = (date - round.start_date).days + 1
+                golf_hole = _OldGolfHole(game_no=round.game, hole_no=hole_no)
+        return cls(wordle_no=wordle_no, date=date, golf_hole=golf_hole)
+
+    def __eq__(self, other):
+        return self.wordle_no == other.wordle_no
+
+
+@dataclasses.dataclass
+class _OldTwitterUser:
+    name: str
+    handle: str
+
+
+@dataclasses.dataclass
+class _OldWordleTweet:
+    created_at: datetime.datetime
+    text: str
+    wordle_day: _OldWordleDay
+    raw_score: int
+    user: _OldTwitterUser
+    tweet_id: str
+
+    @classmethod
+    def from_tweet(cls, tweet, users):
+        wordle = wordlinator.twitter.WORDLE_RE.search(tweet["text"])
+        if not wordle:
+            return None
+        score = wordle.groupdict()["score"]
+        user = [u for u in users if u["id"] == tweet["author_id"]][0]
+        return cls(
+            created_at=dateutil.parser.parse(tweet["created_at"]),
+            text=tweet["text"],
+            tweet_id=tweet["id"],
+            wordle_day=_OldWordleDay.from_wordle_no(int(wordle.group("number"))),
+            raw_score=int(score) if score.isdigit() else 7,
+            user=_OldTwitterUser(name=user["name"], handle=user["username"]),
+        )
+
+
+def _batches(tweet_count, user_count, days):
+    """Tweets shaped like the API's, in pages with their ``includes.users``."""
+    rng = random.Random(0)
+    today = wordlinator.utils.WORDLE_TODAY.wordle_no
+    users = [
+        {"id": f"{i}", "name": f"Player {i}", "username": f"player{i}"}
+        for i in range(user_count)
+    ]
+    batches = []
+    for start in range(0, tweet_count, BATCH_SIZE):
+        tweets = []
+        for idx in range(start, min(start + BATCH_SIZE, tweet_count)):
+            user = rng.choice(users)
+            wordle_no = today - rng.randrange(days)
+            score = rng.choice("123456X")
+            tweets.append(
+                {
+                    "id": f"{10 ** 18 + idx}",
+                    "author_id": user["id"],
+                    "created_at": "2022-07-01T12:00:00.000Z",
+                    "text": f"Wordle {wordle_no} {score}/6\n\n🟩🟩🟩🟩🟩",
+                }
+            )
+        page_users = {t["author_id"] for t in tweets}
+        batches.append((tweets, [u for u in users if u["id"] in page_users]))
+    return batches
+
+
+def _parse(tweet_class, batches):
+    return [
+        tweet_class.from_tweet(tweet, users)
+        for tweets, users in batches
+        for tweet in tweets
+    ]
+
+
+def _measure(tweet_class, batches):
+    tracemalloc.start()
+    parsed = _parse(tweet_class, batches)
+    held, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    seconds = timeit.timeit(lambda: _parse(tweet_class, batches), number=1)
+    return parsed, held, peak, seconds
+
+
+def main():
+    parser = argparse.ArgumentParser("tweet-allocations-benchmark")
+    parser.add_argument("--tweets", type=int, default=50_000)
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--days", type=int, default=60)
+    args = parser.parse_args()
+
+    batches = _batches(args.tweets, args.users, args.days)
+    for name, tweet_class in (
+        ("old", _OldWordleTweet),
+        ("slotted", wordlinator.twitter.WordleTweet),
+    ):
+        parsed, held, peak, seconds = _measure(tweet_class, batches)
+        print(
+            f"{name:>7}: {len(parsed)} tweets, held {held / 2**20:.1f}MiB "
+            f"({held / len(parsed):.0f}B per tweet), peak {peak / 2**20:.1f}MiB, "
+            f"parsed in {seconds:.2f}s"
+        )
+
+    # Looking up one user's tweet for a day, as get_scores does.
+    handle = parsed[0].user.handle
+    user_tweets = [t for t in parsed if t.user.handle == handle]
+    days = [t.wordle_day for t in user_tweets]
+    scan = timeit.timeit(
+        lambda: [[t for t in user_tweets if t.wordle_day == d] for d in days], number=1
+    )
+    by_day = wordlinator.twitter.wordles_by_day(user_tweets)
+    indexed = timeit.timeit(lambda: [by_day.get(d) for d in days], number=1)
+    print(
+        f"day lookups over {len(user_tweets)} tweets: "
+        f"scan {scan / len(days) * 1e6:.2f}us, "
+        f"wordles_by_day {indexed / len(days) * 1e6:.2f}us each"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+"""Gunicorn settings, read from the working directory on startup.
+
+The app is imported once in the master and forked into the workers, which
+share its code and module data until they write to it. Code reloading
+needs a fresh import per worker, so preloading is off when debugging.
+"""
+import gc
+
+import wordlinator
+
+preload_app = not wordlinator.DEBUG
+
+
+def when_ready(server):
+    if not preload_app:
+        return
+    import wordlinator.db.pg
+
+    # Importing the app queries the database; workers open their own.
+    wordlinator.db.pg.db.close()
+    # Keep the garbage collector from touching, and so copying, the objects
+    # imported by the master in every worker.
+    gc.freeze()
+
+
+def worker_exit(server, worker):
+    import wordlinator.web
+
+    wordlinator.web.forget_worker_metrics(worker.pid)
@@ -1,7 +1,7 @@
 #!/bin/bash
 
 RELOAD=""
-if $DEBUG; then
+if [ "$DEBUG" = "true" ]; then
     RELOAD="--reload"
 fi
 poetry run gunicorn $RELOAD -b "0.0.0.0:8050" "wordlinator.web:server"
@@ -0,0 +1,4 @@
+import os
+
+# "true" turns debugging on, anything else (or unset) leaves it off, as in serve.sh.
+DEBUG = os.getenv("DEBUG") == "true"
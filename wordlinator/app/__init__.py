@@ -9,6 +9,8 @@ import wordlinator.db.pg
 import wordlinator.sheets
 import wordlinator.twitter
 import wordlinator.utils
+import wordlinator.utils.career
+import wordlinator.utils.projection
 import wordlinator.utils.scores
 
 
@@ -23,8 +25,7 @@ async def get_scores(
 
     for user in rich.progress.track(users, description="Checking for user scores.."):
         user_scores = await twitter_client.get_user_wordles(user)
-        day_score = [s for s in user_scores if s.wordle_day == wordle_day]
-        scores[user] = day_score[0] if day_score else None
+        scores[user] = wordlinator.twitter.wordles_by_day(user_scores).get(wordle_day)
         await asyncio.sleep(1)
 
     return scores
@@ -84,34 +85,23 @@ def _save_db_scores(
     db_holes = db.get_holes(game_no, ensure_all=True)
     db_scores = db.get_scores(game_no)
 
-    db_scores_by_user = wordlinator.utils.scores.ScoreMatrix(db_scores).by_user(
-        usernames=list(scores.keys())
+    changes = wordlinator.utils.scores.ScoreMatrix(db_scores).reconcile(
+        scores, twitter_scores, db_users, db_holes
     )
+    for user in changes.missing_users:
+        rich.print(f"[yellow]User {user} not in database, cannot add scores.")
 
-    to_update = []
-    to_create = []
-
-    for user, score_list in scores.items():
-        db_user_scores = db_scores_by_user.get(user)
-        if not db_user_scores:
-            continue
-        db_user_match = [u for u in db_users if u.username == user]
-        if not db_user_match:
-            rich.print(f"[yellow]User {user} not in database, cannot add scores.")
-            continue
-        db_user = db_user_match[0]
-        twitter_score = twitter_scores.get(user, None)
-        changes = db_user_scores.get_changes(
-            score_list, twitter_score, db_user, db_holes
-        )
-        to_update.extend(changes["update"])
-        to_create.extend(changes["create"])
+    counts = changes.counts()
+    rich.print(
+        f"[green]{counts['create']} new, {counts['update']} updated, "
+        f"{counts['unchanged']} unchanged scores."
+    )
 
-    if to_update:
-        db.bulk_update_scores(to_update)
+    if changes.update:
+        db.bulk_update_scores(changes.update)
 
-    if to_create:
-        db.bulk_insert_scores(to_create)
+    if changes.create:
+        db.bulk_insert_scores(changes.create)
     return
 
 
@@ -332,5 +322,118 @@ def sync_tweet_missing():
     asyncio.run(tweet_missing())
 
 
+def _show_round_finishes(rounds, username):
+    finishes = [
+        row
+        for row in wordlinator.utils.career.round_finishes(rounds)
+        if row["username"] == username
+    ]
+    table = rich.table.Table(
+        rich.table.Column(header="Round", style="green"),
+        rich.table.Column("Score"),
+        rich.table.Column("Holes"),
+        rich.table.Column("Aces"),
+        rich.table.Column("Finish"),
+        rich.table.Column("Percentile"),
+        title=f"#WordleGolf Career: {username}",
+    )
+    for row in finishes:
+        table.add_row(
+            *[
+                str(row[k])
+                for k in ("game", "golf_score", "holes", "aces", "finish", "percentile")
+            ]
+        )
+    rich.print(table)
+
+
+def show_career():
+    parser = argparse.ArgumentParser("career-stats")
+    parser.add_argument(
+        "username", nargs="?", help="Show one player's finish in each round."
+    )
+    args = parser.parse_args()
+
+    rounds = wordlinator.db.pg.WordleDb().get_rounds()
+    if args.username:
+        _show_round_finishes(rounds, args.username)
+        return
+
+    stats = wordlinator.utils.career.career_stats(rounds)
+    table = rich.table.Table(
+        rich.table.Column(header="Username", style="green"),
+        rich.table.Column("Rounds"),
+        rich.table.Column("Average"),
+        rich.table.Column("Best Round"),
+        rich.table.Column("Best Finish"),
+        rich.table.Column("Aces"),
+        rich.table.Column("Percentile"),
+        title="#WordleGolf Career Stats",
+    )
+    for row in stats:
+        table.add_row(
+            row["username"],
+            *[
+                str(row[k])
+                for k in (
+                    "rounds",
+                    "average",
+                    "best_round",
+                    "best_finish",
+                    "aces",
+                    "percentile",
+                )
+            ],
+        )
+    rich.print(table)
+
+
+def show_projection():
+    parser = argparse.ArgumentParser("project-round")
+    parser.add_argument(
+        "--trials",
+        type=int,
+        default=wordlinator.utils.projection.DEFAULT_TRIALS,
+        help="Simulated rounds.",
+    )
+    parser.add_argument("--processes", type=int, help="Simulate in parallel.")
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=wordlinator.utils.scores.LEADERBOARD_COUNT,
+        help="Players to show.",
+    )
+    args = parser.parse_args()
+
+    golf_hole = wordlinator.utils.WORDLE_TODAY.golf_hole
+    if not golf_hole:
+        raise ValueError("No round is in progress")
+
+    wordle_db = wordlinator.db.pg.WordleDb()
+    scores = wordle_db.get_scores(round_no=golf_hole.game_no)
+    users = wordle_db.get_users_by_round(round_no=golf_hole.game_no)
+    dense = wordlinator.utils.scores.DenseScores.from_scores(
+        scores, [u.username for u in users]
+    )
+    projection = wordlinator.utils.projection.simulate(
+        dense, golf_hole.hole_no, trials=args.trials, processes=args.processes
+    )
+
+    rows = sorted(projection.rows(), key=lambda r: r["Expected Finish"])
+    table = rich.table.Table(
+        rich.table.Column(header="Name", style="green"),
+        rich.table.Column("Expected Score"),
+        rich.table.Column("Expected Finish"),
+        rich.table.Column("Win %"),
+        title=(
+            f"#WordleGolf Round {golf_hole.game_no} Projection "
+            f"(after Hole {golf_hole.hole_no})"
+        ),
+    )
+    for row in rows[: args.top]:
+        table.add_row(*[str(v) for v in row.values()])
+    rich.print(table)
+
+
 if __name__ == "__main__":
     sync_main()
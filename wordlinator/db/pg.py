@@ -1,10 +1,27 @@
 import datetime
 import os
+import time
 import typing
 
 import peewee
 
-db = peewee.PostgresqlDatabase(
+
+class WordleDatabase(peewee.PostgresqlDatabase):
+    """Postgres database reporting each query's duration to ``timing_hooks``."""
+
+    timing_hooks: typing.List[typing.Callable[[str, float], None]] = []
+
+    def execute_sql(self, sql, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return super().execute_sql(sql, *args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            for hook in self.timing_hooks:
+                hook(sql, elapsed)
+
+
+db = WordleDatabase(
     os.getenv("DB_NAME", "wordlegolf"),
     user=os.getenv("DB_USER", "wordlegolf"),
     host=os.environ["DB_HOST"],
@@ -13,6 +30,21 @@ db = peewee.PostgresqlDatabase(
 )
 
 
+_inherited_connections = []
+
+
+def _reset_after_fork():
+    # A connection inherited from the parent shares its socket, and closing
+    # or garbage collecting it would end the parent's session. Keep it
+    # referenced, and have the child open its own on first use.
+    if db._state.conn is not None:
+        _inherited_connections.append(db._state.conn)
+    db._state.reset()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
 class BaseModel(peewee.Model):
     class Meta:
         database = db
@@ -44,6 +76,16 @@ class Game(BaseModel):
         return self.start_date + datetime.timedelta(days=17)
 
 
+def round_overlaps(rounds) -> typing.List[typing.Tuple[Game, Game]]:
+    """Pairs of (earlier, later) rounds whose dates overlap."""
+    rounds = list(sorted(rounds, key=lambda r: r.start_date))
+    return [
+        (prev, curr)
+        for prev, curr in zip(rounds, rounds[1:])
+        if curr.start_date <= prev.end_date
+    ]
+
+
 class Player(BaseModel):
     user_id = peewee.ForeignKeyField(User, "user_id", null=False)
     game_id = peewee.ForeignKeyField(Game, "game_id", null=False)
@@ -120,7 +162,15 @@ class WordleDb:
                         f"Round {round_no} does not exist, "
                         "and no start_date provide to create it"
                     )
-                return Game.create(game=round_no, start_date=start_date)
+                new_round = Game(game=round_no, start_date=start_date)
+                for prev, curr in round_overlaps([*Game.select(), new_round]):
+                    if new_round in (prev, curr):
+                        raise ValueError(
+                            f"Round {curr.game} (starting {curr.start_date}) "
+                            f"overlaps Round {prev.game} (ending {prev.end_date})"
+                        )
+                new_round.save()
+                return new_round
 
     def get_or_create_hole(self, round_no, hole_no):
         with db.atomic():
@@ -252,6 +302,19 @@ class WordleDb:
             )
             db.execute_sql(query)
 
+    def get_round_version(self, round_id):
+        """A fingerprint of a round's scores and players, changing with any edit."""
+        query_str = """SELECT
+            (SELECT COALESCE(md5(string_agg(user_id::text, ',' ORDER BY user_id)), '')
+                FROM player WHERE game_id = %s),
+            COALESCE(md5(string_agg(
+                concat_ws(':', user_id, hole_id, score, tweet_id),
+                ',' ORDER BY user_id, hole_id
+            )), '')
+        FROM score WHERE game_id = %s"""
+        players, digest = db.execute_sql(query_str, (round_id, round_id)).fetchone()
+        return f"{players}-{digest}"
+
     def get_users_without_score(self, round_no, hole_no, tweetable=True):
         hole = self.get_or_create_hole(round_no, hole_no)
         # Find users who *have* played in this round,
@@ -274,3 +337,63 @@ class WordleDb:
 
         res = db.execute_sql(query_str)
         return [r[0] for r in res]
+
+    def _round_finishes_sql(self):
+        # Per player per round totals, ranked within each round.
+        return """WITH round_totals AS (
+            SELECT s.user_id, s.game_id,
+                SUM(s.score - 4) AS golf_score,
+                COUNT(*) AS holes,
+                COUNT(*) FILTER (WHERE s.score = 1) AS aces
+            FROM score s
+            JOIN game g ON g.game_id = s.game_id
+            JOIN player p ON p.user_id = s.user_id AND p.game_id = s.game_id
+            WHERE g.start_date <= %s
+            GROUP BY s.user_id, s.game_id
+        ), finishes AS (
+            SELECT rt.*,
+                RANK() OVER w AS finish,
+                PERCENT_RANK() OVER w AS finish_pct
+            FROM round_totals rt
+            WINDOW w AS (PARTITION BY rt.game_id ORDER BY rt.golf_score)
+        )"""
+
+    def get_round_finishes(self, through_date):
+        """Every player's result in every round starting on or before a date."""
+        query_str = (
+            self._round_finishes_sql()
+            + """
+        SELECT u.username, g.game, f.golf_score, f.holes, f.aces, f.finish,
+            ROUND(((1 - f.finish_pct) * 100)::numeric, 1)::float AS percentile
+        FROM finishes f
+        JOIN user_tbl u ON u.user_id = f.user_id
+        JOIN game g ON g.game_id = f.game_id
+        ORDER BY g.game, f.finish, u.username
+        """
+        )
+        res = db.execute_sql(query_str, (through_date,))
+        columns = [c[0] for c in res.description]
+        return [dict(zip(columns, row)) for row in res]
+
+    def get_career_stats(self, through_date):
+        """Per-player aggregates over every round starting on or before a date."""
+        query_str = (
+            self._round_finishes_sql()
+            + """
+        SELECT u.username,
+            COUNT(*) AS rounds,
+            SUM(f.holes) AS holes,
+            ROUND(4 + SUM(f.golf_score)::numeric / SUM(f.holes), 2)::float AS average,
+            MIN(f.golf_score) AS best_round,
+            MIN(f.finish) AS best_finish,
+            SUM(f.aces) AS aces,
+            ROUND((AVG(1 - f.finish_pct) * 100)::numeric, 1)::float AS percentile
+        FROM finishes f
+        JOIN user_tbl u ON u.user_id = f.user_id
+        GROUP BY u.username
+        ORDER BY average, u.username
+        """
+        )
+        res = db.execute_sql(query_str, (through_date,))
+        columns = [c[0] for c in res.description]
+        return [dict(zip(columns, row)) for row in res]
@@ -4,6 +4,7 @@ import datetime
 import enum
 import os
 import re
+import typing
 import urllib.parse
 import webbrowser
 
@@ -42,7 +43,7 @@ def _get_oauth_creds():
     return creds
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class TwitterUser:
     name: str
     handle: str
@@ -59,7 +60,7 @@ class ScoreName(enum.Enum):
     Bust = 3
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class WordleTweet:
     PAR = 4
 
@@ -102,6 +103,16 @@ class WordleTweet:
         )
 
 
+def wordles_by_day(
+    tweets: typing.List[WordleTweet],
+) -> typing.Dict[wordlinator.utils.WordleDay, WordleTweet]:
+    # Tweets come back newest-first, keep the first tweet seen for each day.
+    by_day: typing.Dict[wordlinator.utils.WordleDay, WordleTweet] = {}
+    for tweet in tweets:
+        by_day.setdefault(tweet.wordle_day, tweet)
+    return by_day
+
+
 class TwitterClient(httpx.AsyncClient):
     SEARCH_PATH = "tweets/search/recent"
     USER_PATH = "users/by/username/{username}"
@@ -111,6 +122,7 @@ class TwitterClient(httpx.AsyncClient):
     TWEET_INTENT_URL = "https://twitter.com/intent/tweet"
 
     MAX_TWEET_LENGTH = 260
+    NOTIFY_HEADER = "Still missing a few #WordleGolf Players today!"
 
     def __init__(
         self,
@@ -213,25 +225,44 @@ class TwitterClient(httpx.AsyncClient):
 
     @classmethod
     def open_tweet(cls, msg):
-        param = urllib.parse.urlencode({"text": msg})
-        webbrowser.open(f"{cls.TWEET_INTENT_URL}?{param}")
+        webbrowser.open(cls.notify_link(msg))
 
     @classmethod
-    def full_notify_link(cls, names):
-        header = "Still missing a few #WordleGolf Players today!"
-        msg = header
-        while names:
-            msg += f" @{names.pop()}"
+    def notify_link(cls, msg):
         param = urllib.parse.urlencode({"text": msg})
         return f"{cls.TWEET_INTENT_URL}?{param}"
 
+    @classmethod
+    def full_notify_link(cls, names):
+        msg = cls.NOTIFY_HEADER
+        for name in reversed(names):
+            msg += f" @{name}"
+        return cls.notify_link(msg)
+
+    @classmethod
+    def notify_messages(cls, names):
+        """Split the missing players' mentions into tweet-sized messages."""
+        messages = []
+        msg = cls.NOTIFY_HEADER
+        for name in reversed(names):
+            mention = f" @{name}"
+            if msg != cls.NOTIFY_HEADER and (
+                len(msg) + len(mention) > cls.MAX_TWEET_LENGTH
+            ):
+                messages.append(msg)
+                msg = cls.NOTIFY_HEADER
+            msg += mention
+        if msg != cls.NOTIFY_HEADER:
+            messages.append(msg)
+        return messages
+
+    @classmethod
+    def notify_links(cls, names):
+        return [cls.notify_link(msg) for msg in cls.notify_messages(names)]
+
     @classmethod
     async def notify_missing(cls, names):
-        header = "Still missing a few #WordleGolf Players today!"
-        msg = header
-        while names:
-            while len(msg) < cls.MAX_TWEET_LENGTH and names:
-                msg += f" @{names.pop()}"
+        for msg in cls.notify_messages(names):
             cls.open_tweet(msg)
 
 
@@ -1,15 +1,48 @@
 import argparse
+import bisect
 import dataclasses
 import datetime
+import functools
+import logging
 import typing
 
 import wordlinator.db.pg
 
+logger = logging.getLogger(__name__)
+
 WORDLE_DAY_ZERO = datetime.date(2021, 6, 19)
 
 WORDLE_GOLF_ROUNDS = wordlinator.db.pg.WordleDb().get_rounds()
 
 
+class RoundIndex:
+    """Sorted interval index of rounds, for O(log n) date lookups."""
+
+    def __init__(self, rounds):
+        self._rounds = list(sorted(rounds, key=lambda r: r.start_date))
+        self._starts = [r.start_date for r in self._rounds]
+        self._ends = [r.end_date for r in self._rounds]
+        # New rounds are checked when created, so don't fail every import
+        # over a bad row. Overlapping dates resolve to the later round.
+        for prev, curr in wordlinator.db.pg.round_overlaps(self._rounds):
+            logger.warning(
+                "Round %s (starting %s) overlaps Round %s (ending %s)",
+                curr.game,
+                curr.start_date,
+                prev.game,
+                prev.end_date,
+            )
+
+    def find(self, date: datetime.date):
+        idx = bisect.bisect_right(self._starts, date) - 1
+        if idx < 0 or date > self._ends[idx]:
+            return None
+        return self._rounds[idx]
+
+
+WORDLE_GOLF_ROUND_INDEX = RoundIndex(WORDLE_GOLF_ROUNDS)
+
+
 def date_from_string(datestr: str):
     try:
         return datetime.date.fromisoformat(datestr)
@@ -18,41 +51,41 @@ def date_from_string(datestr: str):
         raise argparse.ArgumentTypeError(msg)
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, slots=True)
 class GolfHole:
     game_no: int
     hole_no: int
 
     @classmethod
     def from_date(cls, date: datetime.date):
-        for round in WORDLE_GOLF_ROUNDS:
-            if round.start_date <= date <= round.end_date:
-                hole_no = (date - round.start_date).days + 1
-                return cls(game_no=round.game, hole_no=hole_no)
-        return None
+        round = WORDLE_GOLF_ROUND_INDEX.find(date)
+        if not round:
+            return None
+        hole_no = (date - round.start_date).days + 1
+        return cls(game_no=round.game, hole_no=hole_no)
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, slots=True)
 class WordleDay:
     wordle_no: int
-    date: datetime.date
-    golf_hole: typing.Optional[GolfHole]
+    # Both are derived from wordle_no, so equality and hashing only use it.
+    date: datetime.date = dataclasses.field(compare=False)
+    golf_hole: typing.Optional[GolfHole] = dataclasses.field(compare=False)
 
     @classmethod
-    def from_wordle_no(cls, wordle_no: int):
-        wordle_no = int(wordle_no)
+    @functools.lru_cache(maxsize=1024)
+    def _build(cls, wordle_no: int):
         date = WORDLE_DAY_ZERO + datetime.timedelta(days=wordle_no)
         golf_hole = GolfHole.from_date(date)
         return cls(wordle_no=wordle_no, date=date, golf_hole=golf_hole)
 
     @classmethod
-    def from_date(cls, date: datetime.date):
-        wordle_no = (date - WORDLE_DAY_ZERO).days
-        golf_hole = GolfHole.from_date(date)
-        return cls(wordle_no=wordle_no, date=date, golf_hole=golf_hole)
+    def from_wordle_no(cls, wordle_no: int):
+        return cls._build(int(wordle_no))
 
-    def __eq__(self, other):
-        return self.wordle_no == other.wordle_no
+    @classmethod
+    def from_date(cls, date: datetime.date):
+        return cls._build((date - WORDLE_DAY_ZERO).days)
 
 
 # Designed so that "today" will be the current date in CST
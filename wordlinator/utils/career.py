@@ -0,0 +1,49 @@
+import datetime
+import functools
+import typing
+
+import wordlinator.db.pg
+import wordlinator.utils
+
+Game = wordlinator.db.pg.Game
+
+# Scores can still be backfilled the day after a round ends.
+COMPLETE_GRACE = datetime.timedelta(days=1)
+
+
+def is_complete(round: Game, today: typing.Optional[datetime.date] = None) -> bool:
+    today = today or wordlinator.utils.get_today_central()
+    return round.end_date + COMPLETE_GRACE < today
+
+
+def last_completed_round(
+    rounds: typing.List[Game], today: typing.Optional[datetime.date] = None
+) -> typing.Optional[Game]:
+    today = today or wordlinator.utils.get_today_central()
+    completed = [r for r in rounds if is_complete(r, today=today)]
+    return max(completed, key=lambda r: r.start_date) if completed else None
+
+
+# Completed rounds never change, so results only move when another finishes.
+@functools.lru_cache(maxsize=2)
+def _career_stats(game_id: int, through_date: datetime.date):
+    return wordlinator.db.pg.WordleDb().get_career_stats(through_date)
+
+
+@functools.lru_cache(maxsize=2)
+def _round_finishes(game_id: int, through_date: datetime.date):
+    return wordlinator.db.pg.WordleDb().get_round_finishes(through_date)
+
+
+def career_stats(rounds: typing.List[Game], today=None) -> typing.List[typing.Dict]:
+    last_round = last_completed_round(rounds, today=today)
+    if not last_round:
+        return []
+    return _career_stats(last_round.game_id, last_round.start_date)
+
+
+def round_finishes(rounds: typing.List[Game], today=None) -> typing.List[typing.Dict]:
+    last_round = last_completed_round(rounds, today=today)
+    if not last_round:
+        return []
+    return _round_finishes(last_round.game_id, last_round.start_date)
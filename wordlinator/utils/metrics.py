@@ -0,0 +1,129 @@
+import bisect
+import collections
+import threading
+import typing
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (1e3, 1e4, 1e5, 1e6, 1e7)
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 25, 50)
+
+Labels = typing.Tuple[typing.Tuple[str, str], ...]
+Key = typing.Tuple[str, Labels]
+
+
+def _labels(labels: typing.Dict) -> Labels:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+class Metrics:
+    """Counters and histograms for one process, safe to update from threads.
+
+    ``snapshot`` gives a plain dict that can be pickled, merged with other
+    processes' snapshots by ``merge``, and rendered by ``render``.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: typing.Dict[Key, float] = collections.defaultdict(float)
+        self._histograms: typing.Dict[Key, typing.Dict] = {}
+
+    def inc(self, name, value=1, **labels):
+        with self._lock:
+            self._counters[(name, _labels(labels))] += value
+
+    def set(self, name, value, **labels):
+        """Set a counter kept elsewhere, e.g. ``lru_cache`` statistics."""
+        with self._lock:
+            self._counters[(name, _labels(labels))] = value
+
+    def observe(self, name, value, buckets=LATENCY_BUCKETS, **labels):
+        key = (name, _labels(labels))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = {
+                    "buckets": tuple(buckets),
+                    "counts": [0] * len(buckets),
+                    "sum": 0.0,
+                    "count": 0,
+                }
+            idx = bisect.bisect_left(histogram["buckets"], value)
+            if idx < len(histogram["counts"]):
+                histogram["counts"][idx] += 1
+            histogram["sum"] += value
+            histogram["count"] += 1
+
+    def snapshot(self) -> typing.Dict:
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "histograms": {
+                    k: {**h, "counts": list(h["counts"])}
+                    for k, h in self._histograms.items()
+                },
+            }
+
+
+def merge(snapshots: typing.Iterable[typing.Dict]) -> typing.Dict:
+    counters: typing.Dict[Key, float] = collections.defaultdict(float)
+    histograms: typing.Dict[Key, typing.Dict] = {}
+    for snapshot in snapshots:
+        for key, value in snapshot["counters"].items():
+            counters[key] += value
+        for key, histogram in snapshot["histograms"].items():
+            merged = histograms.get(key)
+            if merged is None or merged["buckets"] != histogram["buckets"]:
+                histograms[key] = {**histogram, "counts": list(histogram["counts"])}
+                continue
+            merged["counts"] = [
+                a + b for a, b in zip(merged["counts"], histogram["counts"])
+            ]
+            merged["sum"] += histogram["sum"]
+            merged["count"] += histogram["count"]
+    return {"counters": dict(counters), "histograms": histograms}
+
+
+def _format_labels(labels: Labels, **extra) -> str:
+    pairs = [*labels, *extra.items()]
+    if not pairs:
+        return ""
+    escaped = (
+        (k, v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for k, v in pairs
+    )
+    return "{" + ",".join(f'{k}="{v}"' for k, v in escaped) + "}"
+
+
+def _format_value(value) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render(snapshot: typing.Dict) -> str:
+    """The snapshot in the Prometheus text exposition format."""
+    lines = []
+    counters = collections.defaultdict(list)
+    for (name, labels), value in snapshot["counters"].items():
+        counters[name].append((labels, value))
+    for name, samples in sorted(counters.items()):
+        lines.append(f"# TYPE {name} counter")
+        for labels, value in sorted(samples):
+            lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+
+    histograms = collections.defaultdict(list)
+    for (name, labels), histogram in snapshot["histograms"].items():
+        histograms[name].append((labels, histogram))
+    for name, samples in sorted(histograms.items()):
+        lines.append(f"# TYPE {name} histogram")
+        for labels, histogram in sorted(samples, key=lambda s: s[0]):
+            cumulative = 0
+            for bound, count in zip(histogram["buckets"], histogram["counts"]):
+                cumulative += count
+                le = _format_labels(labels, le=_format_value(float(bound)))
+                lines.append(f"{name}_bucket{le} {cumulative}")
+            le = _format_labels(labels, le="+Inf")
+            lines.append(f"{name}_bucket{le} {histogram['count']}")
+            lines.append(
+                f"{name}_sum{_format_labels(labels)} {_format_value(histogram['sum'])}"
+            )
+            lines.append(f"{name}_count{_format_labels(labels)} {histogram['count']}")
+    return "\n".join(lines) + "\n"
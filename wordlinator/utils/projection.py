@@ -0,0 +1,170 @@
+import dataclasses
+import typing
+import weakref
+
+import multiprocess
+import numpy
+
+import wordlinator.utils.scores
+
+DenseScores = wordlinator.utils.scores.DenseScores
+ScoreMatrix = wordlinator.utils.scores.ScoreMatrix
+
+HOLE_COUNT = wordlinator.utils.scores.HOLE_COUNT
+PAR = wordlinator.utils.scores.PAR
+LEVELS = numpy.array(sorted(wordlinator.utils.scores.SCORE_NAME_MAP))
+
+# How many holes' worth of the round-wide distribution to blend into each
+# player's own, so players with few scores aren't projected off one hole.
+PRIOR_WEIGHT = 4
+DEFAULT_TRIALS = 2000
+
+
+@dataclasses.dataclass
+class Projection:
+    usernames: typing.List[str]
+    trials: int
+    expected_score: numpy.ndarray
+    expected_finish: numpy.ndarray
+    # Per player, the share of trials finishing 1st, 2nd, ... up to
+    # ``positions``, with the last column for anything further back. Tied
+    # players share a finish, so a column can sum to more than 1.
+    finish_probabilities: numpy.ndarray
+
+    @property
+    def win_probability(self) -> numpy.ndarray:
+        return self.finish_probabilities[:, 0]
+
+    def top_probability(self, count: int) -> numpy.ndarray:
+        return self.finish_probabilities[:, :count].sum(axis=1)
+
+    def rows(self):
+        return [
+            {
+                "Name": username,
+                "Expected Score": round(float(self.expected_score[idx]), 1),
+                "Expected Finish": round(float(self.expected_finish[idx]), 1),
+                "Win %": round(float(self.win_probability[idx]) * 100, 1),
+            }
+            for idx, username in enumerate(self.usernames)
+        ]
+
+
+def level_probabilities(dense: DenseScores) -> numpy.ndarray:
+    """Each player's score distribution over ``LEVELS``, shaped players x levels."""
+    player_counts = (dense.values[:, :, None] == LEVELS).sum(axis=1)
+    round_counts = player_counts.sum(axis=0)
+    if not round_counts.any():
+        round_counts = numpy.ones_like(round_counts)
+    prior = round_counts / round_counts.sum() * PRIOR_WEIGHT
+    weights = player_counts + prior
+    return weights / weights.sum(axis=1, keepdims=True)
+
+
+def remaining_holes(dense: DenseScores, hole_no: int) -> numpy.ndarray:
+    """Holes each player can still play, on ``hole_no`` of the round.
+
+    Skipped holes before today are closed, and today's hole only counts
+    for players who haven't posted it yet.
+    """
+    remaining = numpy.full(len(dense.usernames), max(HOLE_COUNT - hole_no, 0))
+    if 0 < hole_no <= HOLE_COUNT:
+        remaining += dense.missing[:, hole_no - 1]
+    return remaining
+
+
+def _simulate(
+    cdf: numpy.ndarray,
+    current: numpy.ndarray,
+    remaining: numpy.ndarray,
+    trials: int,
+    positions: int,
+    seed,
+):
+    rng = numpy.random.default_rng(seed)
+    players = current.size
+    finals = numpy.broadcast_to(current, (trials, players)).astype(numpy.int32)
+
+    # One hole at a time keeps memory at trials x players x levels.
+    for hole_idx in range(int(remaining.max(initial=0))):
+        draws = rng.random((trials, players, 1))
+        level_idx = (draws > cdf).sum(axis=2)
+        strokes = LEVELS[numpy.minimum(level_idx, LEVELS.size - 1)] - PAR
+        finals += strokes * (hole_idx < remaining)
+
+    # Shared ranks per trial from one global sort: offset each trial's
+    # scores into its own disjoint band, then binary search.
+    span = int(finals.max() - finals.min()) + 1
+    banded = finals - finals.min() + numpy.arange(trials)[:, None] * span
+    ranks = numpy.searchsorted(numpy.sort(banded, axis=None), banded) - (
+        numpy.arange(trials)[:, None] * players
+    )
+
+    buckets = numpy.minimum(ranks, positions)
+    histogram = numpy.zeros((players, positions + 1), dtype=numpy.int64)
+    numpy.add.at(histogram, (numpy.arange(players)[None, :], buckets), 1)
+    return finals.sum(axis=0), ranks.sum(axis=0), histogram
+
+
+def simulate(
+    dense: DenseScores,
+    hole_no: int,
+    trials: int = DEFAULT_TRIALS,
+    positions: int = wordlinator.utils.scores.LEADERBOARD_COUNT,
+    processes: typing.Optional[int] = None,
+    seed=None,
+) -> Projection:
+    """Monte Carlo the rest of the round, from ``hole_no`` on, from each
+    player's score distribution.
+
+    With ``processes`` set, trials are split across a ``multiprocess`` pool.
+    """
+    cdf = numpy.cumsum(level_probabilities(dense), axis=1)[None]
+    current = dense.golf_scores
+    remaining = remaining_holes(dense, hole_no)
+
+    chunks = [trials]
+    if processes and processes > 1:
+        chunks = [
+            trials // processes + (i < trials % processes) for i in range(processes)
+        ]
+        chunks = [c for c in chunks if c]
+    seeds = numpy.random.SeedSequence(seed).spawn(len(chunks))
+    args = [(cdf, current, remaining, c, positions, s) for c, s in zip(chunks, seeds)]
+
+    if len(args) > 1:
+        with multiprocess.Pool(len(args)) as pool:
+            results = pool.starmap(_simulate, args)
+    else:
+        results = [_simulate(*args[0])]
+
+    score_sums, rank_sums, histograms = (sum(r) for r in zip(*results))
+    return Projection(
+        usernames=dense.usernames,
+        trials=trials,
+        expected_score=score_sums / trials,
+        expected_finish=rank_sums / trials + 1,
+        finish_probabilities=histograms / trials,
+    )
+
+
+_projections: "weakref.WeakKeyDictionary[ScoreMatrix, typing.Dict]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def project(
+    score_matrix: ScoreMatrix,
+    hole_no: int,
+    trials: int = DEFAULT_TRIALS,
+    processes: typing.Optional[int] = None,
+) -> Projection:
+    """Cached ``simulate`` for a matrix, recomputed when its version changes."""
+    cached = _projections.setdefault(score_matrix, {})
+    version, projection = cached.get((hole_no, trials), (None, None))
+    if version != score_matrix.version:
+        projection = simulate(
+            score_matrix.dense, hole_no, trials=trials, processes=processes
+        )
+        cached[(hole_no, trials)] = (score_matrix.version, projection)
+    return projection
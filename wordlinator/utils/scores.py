@@ -1,7 +1,12 @@
 import collections
+import dataclasses
+import functools
 import itertools
+import operator
 import typing
 
+import numpy
+
 import wordlinator.db.pg
 import wordlinator.twitter
 
@@ -19,12 +24,292 @@ SCORE_NAME_MAP = {
     7: "Fail",
 }
 
+LEVEL_INDEX = {score: idx for idx, score in enumerate(sorted(SCORE_NAME_MAP))}
+
+PAR = 4
+HOLE_COUNT = 18
+LEADERBOARD_COUNT = 20
+
+
+# Per-cell under/at/over par code, shipped alongside each hole for table
+# formatting. Kept to one character since every row carries one per hole.
+SCORE_CATEGORIES = ("u", "p", "o")
+
+
+def category_id(hole_no) -> str:
+    return f"{hole_no}_c"
+
+
+def present_score(username, score, tweet_id=None):
+    if tweet_id:
+        return f"[{score}](https://twitter.com/{username}/status/{tweet_id})"
+    return score
+
+
+################
+# Dense Scores #
+################
+
+
+class DenseScores:
+    """Players x holes array view of a round's scores.
+
+    ``values`` holds raw scores as int8, with ``missing`` masking unplayed
+    holes (whose value is 0). ``tweet_ids`` is a parallel table of tweet ids.
+    Rows follow ``usernames``, column ``i`` is hole ``i + 1``.
+    """
+
+    def __init__(
+        self,
+        usernames: typing.List[str],
+        values: numpy.ndarray,
+        missing: numpy.ndarray,
+        tweet_ids: numpy.ndarray,
+    ):
+        self.usernames = usernames
+        self.user_index = {u: i for i, u in enumerate(usernames)}
+        self.values = values
+        self.missing = missing
+        self.tweet_ids = tweet_ids
+
+    def __getstate__(self):
+        # Cached aggregates are cheap to rebuild, keep the pickle compact.
+        return (self.usernames, self.values, self.missing, self.tweet_ids)
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+    @classmethod
+    def from_scores(
+        cls, scores: typing.List["Score"], usernames: typing.List[str] = []
+    ) -> "DenseScores":
+        # Users with scores keep their first-seen order, the rest follow.
+        user_index: typing.Dict[str, int] = {}
+        for score in scores:
+            user_index.setdefault(score.user_id.username, len(user_index))
+        for username in usernames:
+            user_index.setdefault(username, len(user_index))
+
+        hole_count = max([HOLE_COUNT, *(s.hole_id.hole for s in scores)])
+        shape = (len(user_index), hole_count)
+        values = numpy.zeros(shape, dtype=numpy.int8)
+        missing = numpy.ones(shape, dtype=bool)
+        tweet_ids = numpy.full(shape, None, dtype=object)
+        for score in scores:
+            idx = (user_index[score.user_id.username], score.hole_id.hole - 1)
+            values[idx] = score.score
+            missing[idx] = False
+            tweet_ids[idx] = score.tweet_id
+        return cls(list(user_index), values, missing, tweet_ids)
+
+    @functools.cached_property
+    def counts(self) -> numpy.ndarray:
+        return (~self.missing).sum(axis=1)
+
+    @functools.cached_property
+    def totals(self) -> numpy.ndarray:
+        return self.values.sum(axis=1, dtype=numpy.int32)
+
+    @functools.cached_property
+    def golf_scores(self) -> numpy.ndarray:
+        return self.totals - self.counts * PAR
+
+    @functools.cached_property
+    def hole_counts(self) -> numpy.ndarray:
+        return (~self.missing).sum(axis=0)
+
+    @functools.cached_property
+    def hole_totals(self) -> numpy.ndarray:
+        return self.values.sum(axis=0, dtype=numpy.int32)
+
+    @functools.cached_property
+    def level_counts(self) -> numpy.ndarray:
+        """Count of each ``SCORE_NAME_MAP`` score per hole, shaped levels x holes."""
+        levels = numpy.array(sorted(SCORE_NAME_MAP), dtype=numpy.int8)
+        return (self.values[numpy.newaxis] == levels[:, None, None]).sum(axis=1)
+
+    @staticmethod
+    def _progress(
+        values: numpy.ndarray, missing: numpy.ndarray
+    ) -> typing.Tuple[numpy.ndarray, numpy.ndarray]:
+        # Stable-sort played holes to the left, keeping hole order.
+        order = numpy.argsort(missing, axis=1, kind="stable")
+        relative = numpy.take_along_axis(values.astype(numpy.int16), order, 1)
+        played = ~numpy.take_along_axis(missing, order, 1)
+        return numpy.cumsum((relative - PAR) * played, axis=1), played
+
+    @functools.cached_property
+    def progress(self) -> typing.Tuple[numpy.ndarray, numpy.ndarray]:
+        """Running golf score after each player's n-th played hole.
+
+        Returns the progress matrix and a mask of which entries are valid,
+        matching ``UserRow.progressive_score_list`` row by row.
+        """
+        return self._progress(self.values, self.missing)
+
+    def set_score(self, user_idx: int, hole_idx: int, value: int, tweet_id=None):
+        """Write one score, patching any aggregates already computed."""
+        old_value = int(self.values[user_idx, hole_idx])
+        was_missing = bool(self.missing[user_idx, hole_idx])
+        self.values[user_idx, hole_idx] = value
+        self.missing[user_idx, hole_idx] = False
+        self.tweet_ids[user_idx, hole_idx] = tweet_id
+
+        cached = self.__dict__
+        if "counts" in cached:
+            self.counts[user_idx] += was_missing
+        if "totals" in cached:
+            self.totals[user_idx] += value - old_value
+        if "golf_scores" in cached:
+            self.golf_scores[user_idx] += value - old_value - was_missing * PAR
+        if "hole_counts" in cached:
+            self.hole_counts[hole_idx] += was_missing
+        if "hole_totals" in cached:
+            self.hole_totals[hole_idx] += value - old_value
+        if "level_counts" in cached:
+            if not was_missing:
+                self.level_counts[LEVEL_INDEX[old_value], hole_idx] -= 1
+            self.level_counts[LEVEL_INDEX[value], hole_idx] += 1
+        if "categories" in cached:
+            self.categories[user_idx, hole_idx] = numpy.sign(value - PAR) + 1
+        if "progress" in cached:
+            progress, played = self.progress
+            row = slice(user_idx, user_idx + 1)
+            progress[row], played[row] = self._progress(
+                self.values[row], self.missing[row]
+            )
+
+    @functools.cached_property
+    def categories(self) -> numpy.ndarray:
+        """Index into ``SCORE_CATEGORIES`` for each played cell."""
+        return numpy.sign(self.values.astype(numpy.int16) - PAR) + 1
+
+    def changed_cells(self, previous: "DenseScores") -> numpy.ndarray:
+        """``(user_idx, hole_idx)`` pairs whose score or tweet differ from ``previous``.
+
+        Players are matched by username, ones new to the round count as
+        changed wherever they have played.
+        """
+        rows = numpy.array(
+            [previous.user_index.get(u, -1) for u in self.usernames], dtype=numpy.intp
+        )
+        known = rows >= 0
+        holes = min(previous.values.shape[1], self.values.shape[1])
+
+        prev_values = numpy.zeros_like(self.values)
+        prev_missing = numpy.ones_like(self.missing)
+        prev_tweet_ids = numpy.full(self.tweet_ids.shape, None, dtype=object)
+        prev_values[known, :holes] = previous.values[rows[known], :holes]
+        prev_missing[known, :holes] = previous.missing[rows[known], :holes]
+        prev_tweet_ids[known, :holes] = previous.tweet_ids[rows[known], :holes]
+
+        changed = (self.values != prev_values) | (self.tweet_ids != prev_tweet_ids)
+        changed = (self.missing != prev_missing) | (~self.missing & changed)
+        return numpy.argwhere(changed)
+
+    def user_rows(self, hole_no=None, categories=False):
+        golf_scores = self.golf_scores.tolist()
+        values = self.values.tolist()
+        missing = self.missing.tolist()
+        tweet_ids = self.tweet_ids.tolist()
+        cell_categories = self.categories.tolist() if categories else None
+        rows = []
+        for idx, username in enumerate(self.usernames):
+            row = {"Name": username, "Score": golf_scores[idx]}
+            for hole_idx, hole_missing in enumerate(missing[idx]):
+                if not hole_missing:
+                    row[hole_idx + 1] = present_score(
+                        username, values[idx][hole_idx], tweet_ids[idx][hole_idx]
+                    )
+                    if cell_categories:
+                        row[category_id(hole_idx + 1)] = SCORE_CATEGORIES[
+                            cell_categories[idx][hole_idx]
+                        ]
+                elif hole_no and hole_idx < hole_no:
+                    row[hole_idx + 1] = ""
+            rows.append(row)
+        return rows
+
+
+##################
+# Daily Rankings #
+##################
+
+
+class DailyRankings:
+    """Per-day standings on running golf score, built once from ``DenseScores``.
+
+    Ranks are shared on ties (1, 2, 2, 4). When a tie straddles the top-K
+    cut, earlier users win the remaining places, as a stable sort would.
+    """
+
+    def __init__(self, dense: DenseScores):
+        self.usernames = dense.usernames
+        self.user_index = dense.user_index
+        self._progress, self._valid = dense.progress
+        self.refresh(dense)
+
+    def refresh(self, dense: DenseScores):
+        """Pick up in-place changes to ``dense``'s progress."""
+        self.days = int(dense.counts.max(initial=0))
+        self._sorted_days: typing.Dict[int, numpy.ndarray] = {}
+
+    def _sorted_day(self, day_idx: int) -> numpy.ndarray:
+        if day_idx not in self._sorted_days:
+            day_scores = self._progress[self._valid[:, day_idx], day_idx]
+            self._sorted_days[day_idx] = numpy.sort(day_scores)
+        return self._sorted_days[day_idx]
+
+    def top(
+        self, day: int, count: int = LEADERBOARD_COUNT
+    ) -> typing.List[typing.Tuple[str, int, int]]:
+        """The best ``count`` players on ``day`` as (username, score, rank)."""
+        if not 1 <= day <= self.days:
+            return []
+        day_idx = day - 1
+        users = numpy.flatnonzero(self._valid[:, day_idx])
+        scores = self._progress[users, day_idx]
+
+        if count < users.size:
+            cutoff = numpy.partition(scores, count - 1)[count - 1]
+            better = numpy.flatnonzero(scores < cutoff)
+            tied = numpy.flatnonzero(scores == cutoff)[: count - better.size]
+            keep = numpy.sort(numpy.concatenate([better, tied]))
+            users, scores = users[keep], scores[keep]
+
+        order = numpy.argsort(scores, kind="stable")
+        users, scores = users[order], scores[order]
+        # Everyone ahead of a kept player is kept too, so in-list ranks are exact.
+        ranks = numpy.searchsorted(scores, scores, side="left") + 1
+        return [
+            (self.usernames[u], int(s), int(r))
+            for u, s, r in zip(users.tolist(), scores.tolist(), ranks.tolist())
+        ]
+
+    def rank(self, username: str, day: int) -> typing.Optional[int]:
+        user_idx = self.user_index.get(username)
+        if user_idx is None or not 1 <= day <= self.days:
+            return None
+        day_idx = day - 1
+        if not self._valid[user_idx, day_idx]:
+            return None
+        score = self._progress[user_idx, day_idx]
+        return int(numpy.searchsorted(self._sorted_day(day_idx), score)) + 1
+
+    def top_by_day(self, count: int = LEADERBOARD_COUNT):
+        rankings = collections.defaultdict(list)
+        for day in range(1, self.days + 1):
+            for username, score, _ in self.top(day, count=count):
+                rankings[username].append((day, score))
+        return rankings
+
 
 ###############
 # ScoreMatrix #
 ###############
 
 T = typing.TypeVar("T", bound="ScoreContainer")
+GroupKey = typing.Union[str, typing.Tuple[str, ...]]
 Score = wordlinator.db.pg.Score
 User = wordlinator.db.pg.User
 Hole = wordlinator.db.pg.Hole
@@ -32,32 +317,70 @@ WordleTweet = wordlinator.twitter.WordleTweet
 
 
 class ScoreContainer:
+    __slots__ = ("_scores",)
+
     def __init__(self, scores: typing.List[Score]):
         self._scores = scores
 
     @staticmethod
-    def _get_attribute(score: Score, attribute_path: typing.List[str]):
-        attribute = score
-        for path_part in attribute_path:
-            attribute = getattr(attribute, path_part)
-        return attribute
-
-    def dict_by(
-        self, attribute_path: str, container_class: typing.Type[T]
-    ) -> typing.Dict[typing.Any, T]:
-        data_dict = collections.defaultdict(list)
-        path_parts = attribute_path.split(".")
+    def _accessor(key: GroupKey) -> typing.Callable[[Score], typing.Any]:
+        # attrgetter resolves dotted paths, and returns a tuple for several.
+        paths = (key,) if isinstance(key, str) else key
+        return operator.attrgetter(*paths)
+
+    def group_by(
+        self, *keys: GroupKey
+    ) -> typing.List[typing.Dict[typing.Any, typing.List[Score]]]:
+        """Group scores by each key in a single pass over the scores.
+
+        A key is a dotted attribute path, or a tuple of paths to group by
+        their combination (e.g. ``("score", "hole_id.hole")``).
+        """
+        accessors = [self._accessor(key) for key in keys]
+        groups: typing.List[typing.Dict[typing.Any, typing.List[Score]]] = [
+            {} for _ in keys
+        ]
+        pairs = list(zip(accessors, groups))
 
         for score in self._scores:
-            data_dict[self._get_attribute(score, path_parts)].append(score)
+            for accessor, group in pairs:
+                group.setdefault(accessor(score), []).append(score)
+
+        return groups
 
+    def dict_by(
+        self, attribute_path: GroupKey, container_class: typing.Type[T]
+    ) -> typing.Dict[typing.Any, T]:
+        data_dict = self.group_by(attribute_path)[0]
         return {k: container_class(v) for k, v in data_dict.items()}
 
 
 class ScoreRow(ScoreContainer):
+    """Scores with memoized aggregates.
+
+    Cached values are cleared by ``invalidate``, which must be called after
+    a contained ``Score`` is modified. ``add_score`` invalidates itself.
+    """
+
+    __slots__ = ("_total",)
+
+    def __init__(self, scores):
+        super().__init__(scores)
+        self._total = None
+
+    def invalidate(self):
+        self._total = None
+
+    def add_score(self, score: Score):
+        # Copy rather than append, the list may be shared with a grouping.
+        self._scores = [*self._scores, score]
+        self.invalidate()
+
     @property
     def total(self) -> int:
-        return sum(s.score for s in self._scores)
+        if self._total is None:
+            self._total = sum(s.score for s in self._scores)
+        return self._total
 
     @property
     def count(self) -> int:
@@ -69,9 +392,18 @@ class ScoreRow(ScoreContainer):
 
 
 class UserRow(ScoreRow):
+    __slots__ = ("username", "_sorted", "_progress")
+
     def __init__(self, scores, username=None):
         super().__init__(scores)
         self.username = username or scores[0].user_id.username
+        self._sorted = None
+        self._progress = None
+
+    def invalidate(self):
+        super().invalidate()
+        self._sorted = None
+        self._progress = None
 
     @property
     def golf_score(self) -> int:
@@ -79,26 +411,24 @@ class UserRow(ScoreRow):
 
     @property
     def progressive_score_list(self) -> typing.List[int]:
-        score_progress = list(
-            itertools.accumulate(
-                self.sorted_scores(), func=lambda t, e: t + (e.score - 4), initial=0
-            )
-        )[1:]
-        return score_progress
+        if self._progress is None:
+            self._progress = list(
+                itertools.accumulate(
+                    self.sorted_scores(), func=lambda t, e: t + (e.score - 4), initial=0
+                )
+            )[1:]
+        return self._progress
 
-    def sorted_scores(self):
-        yield from sorted(self._scores, key=lambda s: s.hole_id.hole)
+    def sorted_scores(self) -> typing.Tuple[Score, ...]:
+        if self._sorted is None:
+            self._sorted = tuple(sorted(self._scores, key=lambda s: s.hole_id.hole))
+        return self._sorted
 
     def raw_values(self):
         yield from (s.score for s in self.sorted_scores())
 
     def _present_format(self, score):
-        if score.tweet_id:
-            return (
-                f"[{score.score}]"
-                f"(https://twitter.com/{self.username}/status/{score.tweet_id})"
-            )
-        return score.score
+        return present_score(self.username, score.score, score.tweet_id)
 
     def presentation_values(self, hole_no=None):
         res = {s.hole_id.hole: self._present_format(s) for s in self.sorted_scores()}
@@ -122,99 +452,244 @@ class UserRow(ScoreRow):
         db_user: User,
         db_holes: typing.List[Hole],
     ) -> typing.Dict[str, typing.List[Score]]:
-        current_scores = list(self.sorted_scores())
+        changes = ScoreChanges()
+        _reconcile_user(
+            changes,
+            sheets_scores,
+            twitter_score,
+            db_user,
+            {h.hole: h for h in db_holes},
+            {s.hole_id.hole: s for s in self._scores},
+        )
+        if changes.update:
+            self.invalidate()
+        return {"update": changes.update, "create": changes.create}
 
-        results: typing.Dict[str, typing.List[typing.Any]] = {
-            "update": [],
-            "create": [],
-        }
 
-        for day, score in enumerate(sheets_scores, start=1):
-            try:
-                score = int(score)
-            except ValueError:
-                continue
+class ScoreMatrix(ScoreContainer):
+    GROUPINGS: typing.Dict[str, GroupKey] = {
+        "user": "user_id.username",
+        "hole": "hole_id.hole",
+    }
 
-            hole = [h for h in db_holes if h.hole == day][0]
-            score_match = [s for s in current_scores if s.hole_id.hole == day]
-
-            tweet_id = None
-            if twitter_score and twitter_score.wordle_day.golf_hole.hole_no == day:
-                tweet_id = twitter_score.tweet_id
-
-            if not score_match:
-                results["create"].append(
-                    {
-                        "score": score,
-                        "user_id": db_user.user_id,
-                        "game_id": hole.game_id.game_id,
-                        "hole_id": hole.hole_id,
-                        "tweet_id": tweet_id,
-                    }
-                )
+    def __init__(self, *args, usernames=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.usernames = usernames or []
+        self.version = 0
+
+    def apply_score(self, score: Score) -> int:
+        """Insert or update one score in place, returning the new version.
+
+        Cached groupings, dense aggregates and rankings are patched rather
+        than rebuilt. Rows fetched before the change should be re-fetched.
+        """
+        username = score.user_id.username
+        hole_no = score.hole_id.hole
+        cached = self.__dict__
+
+        user_scores = self.groups["user"].setdefault(username, [])
+        existing = [s for s in user_scores if s.hole_id.hole == hole_no]
+        if existing:
+            existing[0].score = score.score
+            existing[0].tweet_id = score.tweet_id
+        else:
+            self._scores.append(score)
+            user_scores.append(score)
+            self.groups["hole"].setdefault(hole_no, []).append(score)
+
+        if "dense" in cached:
+            dense = self.dense
+            user_idx = dense.user_index.get(username)
+            if user_idx is None or hole_no > dense.values.shape[1]:
+                # A new row or column reshapes every array, so rebuild lazily.
+                cached.pop("dense")
+                cached.pop("rankings", None)
             else:
-                saved_score = score_match[0]
-                if saved_score.score != score or (
-                    tweet_id and saved_score.tweet_id != tweet_id
-                ):
-                    saved_score.score = score
-                    if tweet_id:
-                        saved_score.tweet_id = tweet_id
-                    results["update"].append(saved_score)
+                dense.set_score(user_idx, hole_no - 1, score.score, score.tweet_id)
+                if "rankings" in cached:
+                    self.rankings.refresh(dense)
 
-        return results
+        self.version += 1
+        return self.version
 
+    def apply_scores(self, scores: typing.Iterable[Score]) -> int:
+        for score in scores:
+            self.apply_score(score)
+        return self.version
 
-class ScoreMatrix(ScoreContainer):
-    def __init__(self, *args, usernames=None, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.usernames = usernames or []
+    @classmethod
+    def from_dense(cls, dense: DenseScores) -> "ScoreMatrix":
+        """A matrix serving only the ``dense``-backed views.
+
+        There are no ORM scores behind it, so ``by_user``, ``by_hole`` and
+        ``reconcile`` see an empty round.
+        """
+        score_matrix = cls([], usernames=list(dense.usernames))
+        score_matrix.__dict__["dense"] = dense
+        return score_matrix
+
+    @functools.cached_property
+    def groups(self) -> typing.Dict[str, typing.Dict[typing.Any, typing.List[Score]]]:
+        """Every ``GROUPINGS`` grouping, built together in one pass and cached.
+
+        Score-level counts come from ``dense`` instead of a grouping here.
+        """
+        return dict(zip(self.GROUPINGS, self.group_by(*self.GROUPINGS.values())))
 
     def by_user(self, usernames: typing.List[str] = []):
-        res = self.dict_by("user_id.username", UserRow)
+        res = {k: UserRow(v, k) for k, v in self.groups["user"].items()}
         for username in usernames or self.usernames:
             if username not in res:
                 res[username] = UserRow([], username)
         return res
 
     def for_user(self, username):
-        user_scores = [s for s in self._scores if s.user_id.username == username]
-        return UserRow(scores=user_scores, username=username)
+        user_scores = self.groups["user"].get(username, [])
+        return UserRow(scores=list(user_scores), username=username)
 
     def by_hole(self):
-        return self.dict_by("hole_id.hole", ScoreRow)
+        return {k: ScoreRow(v) for k, v in self.groups["hole"].items()}
 
     def for_hole(self, hole_no):
-        hole_scores = [s for s in self._scores if s.hole_id.hole == hole_no]
-        return ScoreRow(hole_scores)
+        return ScoreRow(list(self.groups["hole"].get(hole_no, [])))
 
-    def _level_counts(self, level_scores: "ScoreMatrix"):
-        hole_dict = level_scores.by_hole()
-        return {k: v.count for k, v in sorted(hole_dict.items())}
+    @functools.cached_property
+    def dense(self) -> DenseScores:
+        return DenseScores.from_scores(self._scores, usernames=self.usernames)
 
-    def score_breakdown(self):
-        by_score_dict = self.dict_by("score", ScoreMatrix)
+    def golf_scores(self) -> typing.Dict[str, int]:
+        return dict(zip(self.dense.usernames, self.dense.golf_scores.tolist()))
+
+    def hole_counts(self) -> typing.Dict[int, int]:
+        counts = self.dense.hole_counts
+        return {int(h) + 1: int(counts[h]) for h in numpy.flatnonzero(counts)}
+
+    def hole_averages(self) -> typing.Dict[int, float]:
+        counts = self.dense.hole_counts
+        totals = self.dense.hole_totals
         return {
-            SCORE_NAME_MAP[k]: self._level_counts(v)
-            for k, v in sorted(by_score_dict.items())
+            int(h) + 1: round(int(totals[h]) / int(counts[h]), 2)
+            for h in numpy.flatnonzero(counts)
         }
 
-    def user_rows(self, wordle_day):
-        hole_no = wordle_day.golf_hole.hole_no
-        return [u.user_row(hole_no=hole_no) for u in self.by_user().values()]
+    def score_breakdown(self):
+        breakdown = {}
+        for level, counts in zip(sorted(SCORE_NAME_MAP), self.dense.level_counts):
+            holes = numpy.flatnonzero(counts)
+            if holes.size:
+                breakdown[SCORE_NAME_MAP[level]] = {
+                    int(h) + 1: int(counts[h]) for h in holes
+                }
+        return breakdown
+
+    def user_rows(self, wordle_day, categories=False):
+        return self.dense.user_rows(
+            hole_no=wordle_day.golf_hole.hole_no, categories=categories
+        )
+
+    @functools.cached_property
+    def rankings(self) -> DailyRankings:
+        return DailyRankings(self.dense)
+
+    def rank_on_day(self, username: str, day: int) -> typing.Optional[int]:
+        return self.rankings.rank(username, day)
+
+    def top_by_day(self, count=LEADERBOARD_COUNT):
+        return self.rankings.top_by_day(count=count)
+
+    def reconcile(
+        self,
+        sheets_scores: typing.Dict[str, typing.List[typing.Any]],
+        twitter_scores: typing.Dict[str, typing.Optional[WordleTweet]],
+        db_users: typing.List[User],
+        db_holes: typing.List[Hole],
+    ) -> "ScoreChanges":
+        """Diff a whole round of sheet scores against the scores in this matrix."""
+        users_by_name = {u.username: u for u in db_users}
+        holes_by_no = {h.hole: h for h in db_holes}
+        saved_by_user: typing.Dict[
+            str, typing.Dict[int, Score]
+        ] = collections.defaultdict(dict)
+        for score in self._scores:
+            saved_by_user[score.user_id.username][score.hole_id.hole] = score
 
-    def top_by_day(self):
-        user_dict = {u: r.progressive_score_list for u, r in self.by_user().items()}
-        days = max(map(len, user_dict.values()))
+        changes = ScoreChanges()
+        for username, score_list in sheets_scores.items():
+            db_user = users_by_name.get(username)
+            if not db_user:
+                changes.missing_users.append(username)
+                continue
+            _reconcile_user(
+                changes,
+                score_list,
+                twitter_scores.get(username),
+                db_user,
+                holes_by_no,
+                saved_by_user.get(username, {}),
+            )
+        return changes
 
-        rankings = collections.defaultdict(list)
-        for day_idx in range(days):
-            day_scores = {
-                u: v[day_idx] for u, v in user_dict.items() if len(v) >= day_idx + 1
-            }
-            tops = [(u, v) for u, v in sorted(day_scores.items(), key=lambda t: t[1])][
-                :20
-            ]
-            for (user, score) in tops:
-                rankings[user].append((day_idx + 1, score))
-        return rankings
+
+##################
+# Reconciliation #
+##################
+
+
+@dataclasses.dataclass
+class ScoreChanges:
+    create: typing.List[typing.Dict[str, typing.Any]] = dataclasses.field(
+        default_factory=list
+    )
+    update: typing.List[Score] = dataclasses.field(default_factory=list)
+    unchanged: typing.List[Score] = dataclasses.field(default_factory=list)
+    missing_users: typing.List[str] = dataclasses.field(default_factory=list)
+
+    def counts(self) -> typing.Dict[str, int]:
+        return {
+            "create": len(self.create),
+            "update": len(self.update),
+            "unchanged": len(self.unchanged),
+        }
+
+
+def _reconcile_user(
+    changes: ScoreChanges,
+    sheets_scores: typing.List[typing.Any],
+    twitter_score: typing.Optional[WordleTweet],
+    db_user: User,
+    holes_by_no: typing.Dict[int, Hole],
+    saved_by_hole: typing.Dict[int, Score],
+):
+    tweet_hole = None
+    if twitter_score and twitter_score.wordle_day.golf_hole:
+        tweet_hole = twitter_score.wordle_day.golf_hole.hole_no
+
+    for day, score in enumerate(sheets_scores, start=1):
+        try:
+            score = int(score)
+        except ValueError:
+            continue
+
+        tweet_id = twitter_score.tweet_id if day == tweet_hole else None
+        saved_score = saved_by_hole.get(day)
+
+        if saved_score is None:
+            hole = holes_by_no[day]
+            changes.create.append(
+                {
+                    "score": score,
+                    "user_id": db_user.user_id,
+                    "game_id": hole.game_id.game_id,
+                    "hole_id": hole.hole_id,
+                    "tweet_id": tweet_id,
+                }
+            )
+        elif saved_score.score != score or (
+            tweet_id and saved_score.tweet_id != tweet_id
+        ):
+            saved_score.score = score
+            if tweet_id:
+                saved_score.tweet_id = tweet_id
+            changes.update.append(saved_score)
+        else:
+            changes.unchanged.append(saved_score)
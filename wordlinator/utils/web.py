@@ -1,5 +1,9 @@
+import functools
+
 from dash import dcc
 
+import wordlinator.utils.scores
+
 ###############
 # Date Helper #
 ###############
@@ -35,114 +39,82 @@ def get_date_dropdown(dates, wordle_day=None):
 # Formatting Helpers #
 ######################
 
+CATEGORY_COLORS = {
+    "o": "red",
+    "p": "orange",
+    "u": "green",
+}
+
 
 def format_string(col, condition):
     return "{" + col["id"] + "}" + f" {condition}"
 
 
-def column_formats(col, pct):
-    return [
+@functools.lru_cache(maxsize=None)
+def _column_formatting(hole_count):
+    hole_ids = [f"{i}" for i in range(1, hole_count + 1)]
+    pct = round((100 - (10 + 5)) / hole_count, 2)
+    formats = [
         {
-            "if": {"column_id": col["id"]},
+            "if": {"column_id": hole_ids},
             "maxWidth": f"{pct}%",
             "width": f"{pct}%",
             "minWidth": f"{pct}%",
-        },
-        # Plain and markdown over-par
-        {
-            "if": {
-                "column_id": col["id"],
-                "filter_query": format_string(col, "> 4"),
-            },
-            "backgroundColor": "red",
-        },
-        {
-            "if": {
-                "column_id": col["id"],
-                "filter_query": format_string(col, 'contains "[5]"'),
-            },
-            "backgroundColor": "red",
-        },
-        {
-            "if": {
-                "column_id": col["id"],
-                "filter_query": format_string(col, 'contains "[6]"'),
-            },
-            "backgroundColor": "red",
-        },
-        {
-            "if": {
-                "column_id": col["id"],
-                "filter_query": format_string(col, 'contains "[7]"'),
-            },
-            "backgroundColor": "red",
-        },
-        # Plain and Markdown par
-        {
-            "if": {
-                "column_id": col["id"],
-                "filter_query": format_string(col, "= 4"),
-            },
-            "backgroundColor": "orange",
-        },
-        {
-            "if": {
-                "column_id": col["id"],
-                "filter_query": format_string(col, 'contains "[4]"'),
-            },
-            "backgroundColor": "orange",
-        },
-        # Plain and markdown under par
-        {
-            "if": {
-                "column_id": col["id"],
-                "filter_query": format_string(col, "< 4"),
-            },
-            "backgroundColor": "green",
-        },
-        {
-            "if": {
-                "column_id": col["id"],
-                "filter_query": format_string(col, 'contains "[3]"'),
-            },
-            "backgroundColor": "green",
-        },
-        {
-            "if": {
-                "column_id": col["id"],
-                "filter_query": format_string(col, 'contains "[2]"'),
-            },
-            "backgroundColor": "green",
-        },
-        {
-            "if": {
-                "column_id": col["id"],
-                "filter_query": format_string(col, 'contains "[1]"'),
-            },
-            "backgroundColor": "green",
-        },
-        # Plain no score
-        {
-            "if": {
-                "column_id": col["id"],
-                "filter_query": format_string(col, "is nil"),
-            },
-            "backgroundColor": "white",
-        },
-        {
-            "if": {
-                "column_id": col["id"],
-                "filter_query": format_string(col, "= ''"),
-            },
-            "backgroundColor": "white",
-        },
+        }
     ]
+    # Colors key off the server-computed category for each cell,
+    # rather than parsing the (possibly markdown) cell value.
+    for hole_id in hole_ids:
+        category_col = {"id": wordlinator.utils.scores.category_id(hole_id)}
+        formats.extend(
+            {
+                "if": {
+                    "column_id": hole_id,
+                    "filter_query": format_string(category_col, f'= "{category}"'),
+                },
+                "backgroundColor": color,
+            }
+            for category, color in CATEGORY_COLORS.items()
+        )
+    return formats
 
 
 def column_formatting(hole_columns):
-    pct = round((100 - (10 + 5)) / len(hole_columns), 2)
-    return [
-        entry
-        for format_list in [column_formats(hole, pct) for hole in hole_columns]
-        for entry in format_list
-    ]
+    return list(_column_formatting(len(hole_columns)))
+
+
+##################
+# Filter Helpers #
+##################
+
+# Longest first, so e.g. "icontains" isn't read as "contains".
+FILTER_OPERATORS = [
+    ["ge ", ">="],
+    ["le ", "<="],
+    ["lt ", "<"],
+    ["gt ", ">"],
+    ["ne ", "!="],
+    ["eq ", "="],
+    ["icontains "],
+    ["contains "],
+]
+
+
+def split_filter_part(filter_part):
+    for operator_type in FILTER_OPERATORS:
+        for operator in operator_type:
+            if operator in filter_part:
+                name_part, value_part = filter_part.split(operator, 1)
+                name = name_part.strip().lstrip("{").rstrip("}")
+                value = value_part.strip()
+                quote = value[:1]
+                if quote and quote == value[-1] and quote in ("'", '"', "`"):
+                    value = value[1:-1].replace("\\" + quote, quote)
+                return name, operator_type[0].strip(), value
+    return None, None, None
+
+
+def split_filter_query(filter_query):
+    """Parse a DataTable ``filter_query`` into (column, operator, value) parts."""
+    parts = [split_filter_part(p) for p in (filter_query or "").split(" && ")]
+    return [p for p in parts if p[0]]
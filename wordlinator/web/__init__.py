@@ -1,27 +1,42 @@
+import argparse
 import collections
+import contextlib
+import copy
 import functools
+import gzip
+import hashlib
+import json
 import math
 import os
 import pathlib
-import re
+import threading
 import time
+import uuid
 
 import dash
 import dash.long_callback
 import diskcache
 import flask
 import flask.views
-import plotly.graph_objs
+import numpy
+import plotly.io
 
 import wordlinator.db.pg as db
 import wordlinator.twitter
 import wordlinator.utils
+import wordlinator.utils.career
+import wordlinator.utils.metrics
+import wordlinator.utils.projection
 import wordlinator.utils.scores
 import wordlinator.utils.web
 
-TTL_TIME = 30 if os.getenv("DEBUG") else 90
+TTL_TIME = 30 if wordlinator.DEBUG else 90
 LEADERBOARD_COUNT = 20
-VALUE_RE = re.compile(r"\[(?P<value>-?\d+)\]")
+PAGE_SIZE = 50
+# Completed rounds only change if they are invalidated by hand.
+API_FINAL_MAX_AGE = 7 * 24 * 60 * 60
+# Rounds up to this many players ship every row and sort in the browser.
+CLIENTSIDE_SORT_ROWS = 500
 
 ###################
 # Setup Functions #
@@ -41,18 +56,43 @@ def get_ttl_hash(seconds=TTL_TIME):
 
 
 cache = diskcache.Cache("./cache")
-long_callback_manager = dash.long_callback.DiskcacheLongCallbackManager(
-    cache, cache_by=get_ttl_hash
-)
+metrics = wordlinator.utils.metrics.Metrics()
+
+# Live round data is keyed by version, so entries only need to outlive
+# their use. Completed rounds never change and are kept until invalidated.
+DATA_EXPIRE = 24 * 60 * 60
+LOCK_EXPIRE = 60
+FINAL_VERSION = "final"
+_MISSING = object()
+
+
+def shared_get(key, compute, expire=None, tag=None):
+    """Get ``key`` from the cache shared by all workers, computing it if missing.
+
+    Only one worker computes a missing key, the rest wait for its result.
+    """
+    value = cache.get(key, default=_MISSING)
+    if value is not _MISSING:
+        metrics.inc("wordlinator_cache_requests_total", cache=key[0], result="hit")
+        return value
+    with diskcache.Lock(cache, ("lock", *key), expire=LOCK_EXPIRE):
+        value = cache.get(key, default=_MISSING)
+        if value is _MISSING:
+            metrics.inc("wordlinator_cache_requests_total", cache=key[0], result="miss")
+            value = compute()
+            cache.set(key, value, expire=expire, tag=tag)
+        else:
+            metrics.inc("wordlinator_cache_requests_total", cache=key[0], result="wait")
+    return value
 
 
 @functools.lru_cache(maxsize=1)
 def _games_from_db(ttl_hash=None):
-    return db.WordleDb().get_rounds()
+    return shared_get(("games",), db.WordleDb().get_rounds, expire=TTL_TIME)
 
 
 def games_from_db():
-    return _games_from_db()
+    return _games_from_db(get_ttl_hash())
 
 
 @functools.lru_cache(maxsize=1)
@@ -81,17 +121,142 @@ def round_wordle_day(round_id):
     return wordlinator.utils.WordleDay.from_date(matching_round.end_date)
 
 
-@functools.lru_cache(maxsize=3)
-def _scores_from_db(round_id, ttl_hash=None):
+def round_is_complete(round_id):
+    matching_round = [r for r in games_from_db() if r.game_id == round_id]
+    if not matching_round:
+        return False
+    return wordlinator.utils.career.is_complete(matching_round[0])
+
+
+# Versions pinned by the refresher while it precomputes a new version.
+_pinned = threading.local()
+
+
+@contextlib.contextmanager
+def pinned_version(round_id, version):
+    """Serve ``version`` of a round to this thread while the block runs."""
+    _pinned.versions = {round_id: version}
+    try:
+        yield
+    finally:
+        _pinned.versions = {}
+
+
+def round_version(round_id):
+    pinned = getattr(_pinned, "versions", {}).get(round_id)
+    if pinned:
+        return pinned
+    if round_is_complete(round_id):
+        # Bumped by invalidate_round, so every worker sees the change.
+        generation = cache.get(("generation", round_id), default=0)
+        return f"{FINAL_VERSION}-{generation}"
+    return shared_get(
+        ("version", round_id),
+        lambda: db.WordleDb().get_round_version(round_id),
+        expire=TTL_TIME,
+    )
+
+
+def _is_final(version):
+    return version.startswith(FINAL_VERSION)
+
+
+def _requested_round_version():
+    # The requested round's data version and hole, so background results
+    # are reused until the data behind them changes, and changes to the
+    # live round leave completed rounds' results alone.
+    round_id = dash.callback_context.inputs.get("round-selector-dropdown.value")
+    if not any(g.game_id == round_id for g in games_from_db()):
+        return None
+    return round_version(round_id), round_wordle_day(round_id).wordle_no
+
+
+long_callback_manager = dash.long_callback.DiskcacheLongCallbackManager(
+    cache, cache_by=[_requested_round_version], expire=DATA_EXPIRE
+)
+
+
+def _round_get(key, round_id, version, compute):
+    if _is_final(version):
+        return shared_get(key, compute, tag=f"round-{round_id}")
+    return shared_get(key, compute, expire=DATA_EXPIRE)
+
+
+def invalidate_round(round_id):
+    """Drop a completed round's cached data, in every worker and on disk."""
+    cache.incr(("generation", round_id), default=0)
+    cache.evict(f"round-{round_id}")
+    _drop_final_payloads(round_id)
+
+
+def _dense_from_db(round_id):
     wordle_db = db.WordleDb()
     scores = wordle_db.get_scores(round_id=round_id)
     users = wordle_db.get_users_by_round(round_id=round_id)
     usernames = [u.username for u in users]
-    return wordlinator.utils.scores.ScoreMatrix(scores, usernames=usernames)
+    return wordlinator.utils.scores.DenseScores.from_scores(scores, usernames)
+
+
+def _load_scores(round_id, version):
+    dense = _round_get(
+        ("matrix", round_id, version),
+        round_id,
+        version,
+        lambda: _dense_from_db(round_id),
+    )
+    return wordlinator.utils.scores.ScoreMatrix.from_dense(dense)
+
+
+# Completed rounds get their own unbounded cache,
+# so browsing history can't evict the live round.
+_final_scores = functools.lru_cache(maxsize=None)(_load_scores)
+_scores_from_db = functools.lru_cache(maxsize=3)(_load_scores)
 
 
 def scores_from_db(round_id):
-    return _scores_from_db(round_id, get_ttl_hash())
+    version = round_version(round_id)
+    if _is_final(version):
+        return _final_scores(round_id, version)
+    return _scores_from_db(round_id, version)
+
+
+_final_payloads: dict = {}
+
+
+def round_payload(name, round_id, compute):
+    """A rendered payload for a round, shared by workers until its data changes.
+
+    Completed rounds' payloads are shared in memory, so callers must not
+    modify what they get.
+    """
+    version = round_version(round_id)
+    key = ("payload", name, round_id, version)
+    if not _is_final(version):
+        return _round_get(key, round_id, version, compute)
+    if key not in _final_payloads:
+        # A new generation makes the round's older payloads unreachable.
+        _drop_final_payloads(round_id, keep=version)
+        _final_payloads[key] = _round_get(key, round_id, version, compute)
+    return _final_payloads[key]
+
+
+def _drop_final_payloads(round_id, keep=None):
+    """Forget a round's payloads from other versions than ``keep``."""
+    for key in list(_final_payloads):
+        if key[2] == round_id and key[3] != keep:
+            del _final_payloads[key]
+
+
+def clear_round_cache():
+    parser = argparse.ArgumentParser("clear-round-cache")
+    parser.add_argument("round_nos", type=int, nargs="+", help="Round number(s).")
+    args = parser.parse_args()
+
+    rounds = {r.game: r for r in db.WordleDb().get_rounds()}
+    for round_no in args.round_nos:
+        if round_no not in rounds:
+            raise ValueError(f"Round {round_no} does not exist")
+        invalidate_round(rounds[round_no].game_id)
 
 
 #######################
@@ -101,14 +266,13 @@ def scores_from_db(round_id):
 
 def get_leaderboard(round_id):
     score_matrix = scores_from_db(round_id)
-    user_scores = score_matrix.by_user()
+    user_scores = score_matrix.golf_scores()
     top_20 = dict(
-        list(sorted(user_scores.items(), key=lambda u: u[1].golf_score))[
-            :LEADERBOARD_COUNT
-        ]
+        list(sorted(user_scores.items(), key=lambda u: u[1]))[:LEADERBOARD_COUNT]
     )
     return dash.dash_table.DataTable(
-        [{"Name": k, "Score": v.golf_score} for k, v in top_20.items()],
+        [{"Name": k, "Score": v} for k, v in top_20.items()],
+        id="leaderboard-table",
         style_as_list_view=True,
         style_table={"width": "40%", "margin": "auto"},
         style_cell={"textAlign": "center"},
@@ -120,16 +284,139 @@ def get_leaderboard(round_id):
 #################
 
 
-def _get_scores(round_id):
-    score_matrix = scores_from_db(round_id)
+def get_score_rows(round_id):
+    """The user-scores rows for a round, shared between callers, so read-only."""
     round_day = round_wordle_day(round_id)
-    table_rows = score_matrix.user_rows(round_day)
-    return table_rows
+
+    def _compute():
+        return scores_from_db(round_id).user_rows(round_day, categories=True)
+
+    # Rows are padded out to the current hole, so they change daily too.
+    name = f"user-rows-{round_day.wordle_no}"
+    return round_payload(name, round_id, _compute)
+
+
+def _score_index(round_id):
+    """Per-column sort keys and ascending row orders for the user-scores rows.
+
+    Rows are in ``DenseScores`` order. Each order lists played rows first,
+    ``counts`` gives how many, then the blanks.
+    """
+    round_day = round_wordle_day(round_id)
+
+    def _compute():
+        dense = scores_from_db(round_id).dense
+        names = dense.usernames
+        keys = {
+            "Name": numpy.array([n.lower() for n in names], dtype=object),
+            "Score": dense.golf_scores.astype(float),
+        }
+        for hole_idx in range(round_day.golf_hole.hole_no):
+            values = dense.values[:, hole_idx].astype(float)
+            values[dense.missing[:, hole_idx]] = numpy.nan
+            keys[f"{hole_idx + 1}"] = values
+
+        # An empty round's order would otherwise come out as floats.
+        orders = {
+            "Name": numpy.array(
+                sorted(range(len(names)), key=names.__getitem__), dtype=numpy.intp
+            )
+        }
+        counts = {"Name": len(names)}
+        for col, values in keys.items():
+            if col != "Name":
+                # NaN (unplayed) sorts last.
+                orders[col] = numpy.argsort(values, kind="stable")
+                counts[col] = int((~numpy.isnan(values)).sum())
+        return {"keys": keys, "orders": orders, "counts": counts}
+
+    return round_payload(f"score-index-{round_day.wordle_no}", round_id, _compute)
+
+
+def _filter_mask(keys, filter_query):
+    mask = numpy.ones(len(keys["Name"]), dtype=bool)
+    for col, operator, value in wordlinator.utils.web.split_filter_query(filter_query):
+        if col not in keys:
+            continue
+        col_keys = keys[col]
+        if col == "Name":
+            value = value.lower()
+            if operator in ("contains", "icontains"):
+                mask &= numpy.array([value in k for k in col_keys], dtype=bool)
+            else:
+                mask &= _compare(col_keys, operator, value)
+            continue
+        try:
+            number = float(value)
+        except ValueError:
+            mask[:] = False
+            continue
+        played = ~numpy.isnan(col_keys)
+        if operator in ("contains", "icontains"):
+            text = [f"{k:.0f}" if p else "" for k, p in zip(col_keys, played)]
+            mask &= numpy.array([value in t for t in text], dtype=bool)
+        else:
+            mask &= played & _compare(col_keys, operator, number)
+    return mask
+
+
+def _compare(values, operator, value):
+    return {
+        "eq": values == value,
+        "ne": values != value,
+        "lt": values < value,
+        "le": values <= value,
+        "gt": values > value,
+        "ge": values >= value,
+    }.get(operator, numpy.ones(len(values), dtype=bool))
+
+
+# Paging through a round re-reads the same rows and row order, keep them
+# in memory rather than loading them from the shared cache every click.
+@functools.lru_cache(maxsize=3)
+def _page_rows(round_id, version, wordle_no):
+    return get_score_rows(round_id)
+
+
+@functools.lru_cache(maxsize=32)
+def _page_order(round_id, version, wordle_no, sort_col, descending, filter_query):
+    """Row indexes of the user-scores rows, filtered and sorted."""
+    index = _score_index(round_id)
+    order = numpy.arange(len(index["keys"]["Name"]))
+    if sort_col:
+        order = index["orders"].get(sort_col, order)
+        if descending:
+            # Reverse the played rows, blanks stay last.
+            played = index["counts"].get(sort_col, len(order))
+            order = numpy.concatenate([order[:played][::-1], order[played:]])
+
+    mask = _filter_mask(index["keys"], filter_query)
+    return order[mask[order]]
+
+
+def page_score_rows(round_id, page_current, page_size, sort_by, filter_query):
+    """One page of user-scores rows, filtered and sorted server-side."""
+    key = (round_id, round_version(round_id), round_wordle_day(round_id).wordle_no)
+    rows = _page_rows(*key)
+    sort_col = sort_by[0]["column_id"] if sort_by else None
+    descending = bool(sort_by) and sort_by[0]["direction"] == "desc"
+    order = _page_order(*key, sort_col, descending, filter_query or "")
+
+    page_count = max(math.ceil(order.size / page_size), 1)
+    start = page_current * page_size
+    page = order[start:][:page_size]
+    return [rows[i] for i in page], page_count
 
 
 def get_scores(round_id):
     round_day = round_wordle_day(round_id)
-    table_rows = _get_scores(round_id)
+    sort_by = [{"column_id": "Name", "direction": "asc"}]
+    row_count = len(get_score_rows(round_id))
+    clientside = row_count <= CLIENTSIDE_SORT_ROWS
+    # A round nobody has joined yet still needs a page of (no) rows.
+    table_rows, page_count = page_score_rows(
+        round_id, 0, max(row_count, 1) if clientside else PAGE_SIZE, sort_by, ""
+    )
 
     hole_columns = [
         {"name": f"{i}", "id": f"{i}", "type": "text", "presentation": "markdown"}
@@ -159,10 +446,25 @@ def get_scores(round_id):
         },
         *color_formatting,
     ]
+    if clientside:
+        # All rows are in the browser: page and filter natively, and sort
+        # with the scores.sortRows clientside callback.
+        paging = {
+            "id": "user-scores-local-table",
+            "page_action": "native",
+            "filter_action": "native",
+        }
+    else:
+        paging = {
+            "id": "user-scores-table",
+            "page_action": "custom",
+            "page_count": page_count,
+            "filter_action": "custom",
+            "filter_query": "",
+        }
     return dash.dash_table.DataTable(
         table_rows,
         columns,
-        id="user-scores-table",
         style_table={
             "width": "80%",
             "margin": "auto",
@@ -170,7 +472,8 @@ def get_scores(round_id):
             "overflowY": "auto",
         },
         fixed_rows={"headers": True, "data": 0},
-        filter_action="native",
+        page_current=0,
+        page_size=PAGE_SIZE,
         filter_options={"case": "insensitive"},
         style_cell={"textAlign": "center"},
         style_data={"width": "10%"},
@@ -178,7 +481,8 @@ def get_scores(round_id):
         style_data_conditional=formatting,
         sort_action="custom",
         sort_mode="single",
-        sort_by=[{"column_id": "Name", "direction": "asc"}],
+        sort_by=sort_by,
+        **paging,
     )
 
 
@@ -188,30 +492,27 @@ def get_scores(round_id):
 
 
 def _get_summary_rows(score_matrix):
-    day_dict = score_matrix.by_hole()
+    totals = {"Score": "Total", **score_matrix.hole_counts()}
+    averages = {"Score": "Daily Average", **score_matrix.hole_averages()}
 
-    totals = {
-        "Score": "Total",
-        **{day: scores.count for day, scores in day_dict.items()},
-    }
+    return [totals, averages]
 
-    averages = {
-        "Score": "Daily Average",
-        **{day: scores.average for day, scores in day_dict.items()},
-    }
 
-    return [totals, averages]
+def get_stats_rows(round_id):
+    """The daily stats rows for a round, shared between callers, so read-only."""
 
+    def _compute():
+        score_matrix = scores_from_db(round_id)
+        breakdown = score_matrix.score_breakdown()
+        table_rows = [{"Score": k, **v} for k, v in breakdown.items()]
+        table_rows.extend(_get_summary_rows(score_matrix))
+        return table_rows
 
-def _stats_dict(round_id):
-    score_matrix = scores_from_db(round_id)
-    table_rows = [{"Score": k, **v} for k, v in score_matrix.score_breakdown().items()]
-    table_rows.extend(_get_summary_rows(score_matrix))
-    return table_rows
+    return round_payload("stats", round_id, _compute)
 
 
 def get_daily_stats(round_id):
-    table_rows = _stats_dict(round_id)
+    table_rows = get_stats_rows(round_id)
 
     columns = [
         {"name": n, "id": n}
@@ -251,12 +552,26 @@ SCORE_COLOR_DICT = {
 }
 
 
+# Figures are built as plain dicts, skipping plotly's validating objects.
+# The default template is what plotly would have attached to each figure.
+FIGURE_TEMPLATE = plotly.io.templates[plotly.io.templates.default].to_plotly_json()
+
+
+def _figure(data, **layout):
+    return {"data": data, "layout": {"template": FIGURE_TEMPLATE, **layout}}
+
+
 def get_line_graph(round_id):
-    rows = _stats_dict(round_id)
-    figure = plotly.graph_objs.Figure()
+    figure = round_payload("line-graph", round_id, lambda: _line_graph_figure(round_id))
+    return dash.dcc.Graph(figure=figure, id="stats-graph-figure")
+
+
+def _line_graph_figure(round_id):
+    rows = copy.deepcopy(get_stats_rows(round_id))
     total = [r for r in rows if r["Score"] == "Total"][0]
     rows = [r for r in rows if r["Score"] not in ("Total", "Daily Average")]
     total.pop("Score")
+    data = []
     for row in rows:
         score = row.pop("Score")
         y_values = []
@@ -265,20 +580,22 @@ def get_line_graph(round_id):
             total_val = total.get(k)
             pct = row_val / total_val * 100
             y_values.append(pct)
-        figure.add_trace(
-            plotly.graph_objs.Scatter(
-                x=list(row.keys()),
-                y=y_values,
-                fill="tonexty",
-                name=score,
-                line={"color": SCORE_COLOR_DICT[score]},
-                stackgroup="dailies",
-            )
+        data.append(
+            {
+                "type": "scatter",
+                "x": list(row.keys()),
+                "y": y_values,
+                "fill": "tonexty",
+                "name": score,
+                "line": {"color": SCORE_COLOR_DICT[score]},
+                "stackgroup": "dailies",
+            }
         )
-    figure.update_xaxes(tickvals=list(total.keys()), title_text="Days")
-    figure.update_yaxes(title_text="Percent")
-    figure.update_layout(yaxis_range=[0, 100])
-    return dash.dcc.Graph(figure=figure)
+    return _figure(
+        data,
+        xaxis={"tickvals": list(total.keys()), "title": {"text": "Days"}},
+        yaxis={"title": {"text": "Percent"}, "range": [0, 100]},
+    )
 
 
 #####################
@@ -287,23 +604,31 @@ def get_line_graph(round_id):
 
 
 def line_race_graph(round_id):
+    round_day = round_wordle_day(round_id)
+    figure = round_payload(
+        f"line-race-{round_day.wordle_no}",
+        round_id,
+        lambda: _line_race_figure(round_id, round_day),
+    )
+    return dash.dcc.Graph(figure=figure, id="leaderboard-race-figure")
+
+
+def _line_race_figure(round_id, round_day):
     score_matrix = scores_from_db(round_id)
     tops_by_day = score_matrix.top_by_day()
-    round_day = round_wordle_day(round_id)
     hole_no = round_day.golf_hole.hole_no
 
-    figure = plotly.graph_objs.Figure()
-    figure.update_yaxes(autorange="reversed")
-    figure.update_xaxes(tickmode="linear", tick0=1, dtick=1)
+    data = []
     annotation_names = collections.defaultdict(list)
     for name, entries in tops_by_day.items():
-        figure.add_trace(
-            plotly.graph_objs.Scatter(
-                name=name,
-                mode="lines+markers",
-                x=[e[0] for e in entries],
-                y=[e[1] for e in entries],
-            )
+        data.append(
+            {
+                "type": "scatter",
+                "name": name,
+                "mode": "lines+markers",
+                "x": [e[0] for e in entries],
+                "y": [e[1] for e in entries],
+            }
         )
         if entries[-1][0] == hole_no:
             annotation_names[entries[-1]].append(name)
@@ -312,152 +637,767 @@ def line_race_graph(round_id):
         {"x": k[0], "y": k[1], "text": ", ".join(v)}
         for k, v in annotation_names.items()
     ]
-    figure.update_layout(annotations=annotations)
-    return dash.dcc.Graph(figure=figure)
+    return _figure(
+        data,
+        xaxis={"tickmode": "linear", "tick0": 1, "dtick": 1},
+        yaxis={"autorange": "reversed"},
+        annotations=annotations,
+    )
+
+
+##################
+# Career Helpers #
+##################
+
+CAREER_COLUMNS = {
+    "username": "Name",
+    "rounds": "Rounds",
+    "average": "Average",
+    "best_round": "Best Round",
+    "best_finish": "Best Finish",
+    "aces": "Aces",
+    "percentile": "Percentile",
+}
+
+
+def get_career_stats():
+    stats = wordlinator.utils.career.career_stats(games_from_db())
+    return dash.dash_table.DataTable(
+        stats,
+        columns=[{"name": v, "id": k} for k, v in CAREER_COLUMNS.items()],
+        style_as_list_view=True,
+        style_table={"width": "80%", "margin": "auto"},
+        style_cell={"textAlign": "center"},
+        sort_action="native",
+    )
+
+
+###################
+# Cache Refresher #
+###################
+
+# Refresh well inside TTL_TIME so the live version never expires under users.
+REFRESH_INTERVAL = TTL_TIME / 3
+LEADER_KEY = ("refresher-leader",)
+_refresher = {"pid": None, "worker_id": None}
+
+
+def active_round_id():
+    game_no = wordle_today().golf_hole.game_no
+    return [g for g in games_from_db() if g.game == game_no][0].game_id
+
+
+def missing_players():
+    """Today's players without a score, with their notify tweet links.
+
+    Keyed on the live round's version, so it is rebuilt once scores change.
+    """
+    round_id = active_round_id()
+    today = wordle_today()
+
+    def _compute():
+        names = db.WordleDb().get_users_without_score(
+            today.golf_hole.game_no, today.golf_hole.hole_no
+        )
+        client = wordlinator.twitter.TwitterClient
+        return {
+            "missing": names,
+            "link": client.full_notify_link(names),
+            "parts": client.notify_links(names),
+        }
+
+    return round_payload(f"missing-{today.wordle_no}", round_id, _compute)
+
+
+def warm_round(round_id):
+    if round_id == active_round_id():
+        missing_players()
+    get_leaderboard(round_id)
+    line_race_graph(round_id)
+    get_line_graph(round_id)
+    get_daily_stats(round_id)
+    get_scores(round_id)
+
+
+def refresh_round(round_id):
+    """Precompute a round's payloads, then publish its version to workers."""
+    if round_is_complete(round_id):
+        warm_round(round_id)
+        return
+    previous_version = cache.get(("version", round_id))
+    version = db.WordleDb().get_round_version(round_id)
+    with pinned_version(round_id, version):
+        warm_round(round_id)
+        if previous_version and previous_version != version:
+            publish_event(round_id, _score_event(round_id, previous_version, version))
+    cache.set(("version", round_id), version, expire=TTL_TIME)
+
+
+def _is_leader():
+    worker_id = _refresher["worker_id"]
+    lease = REFRESH_INTERVAL * 3
+    if cache.add(LEADER_KEY, worker_id, expire=lease):
+        return True
+    if cache.get(LEADER_KEY) == worker_id:
+        cache.touch(LEADER_KEY, expire=lease)
+        return True
+    return False
+
+
+def _refresh_loop():
+    while True:
+        try:
+            if _is_leader():
+                refresh_round(active_round_id())
+        except Exception:
+            server.logger.exception("Cache refresh failed")
+        time.sleep(REFRESH_INTERVAL)
+
+
+def start_refresher():
+    """Start this worker's refresher thread, once per process.
+
+    Every worker runs one, but only the current lease holder does any work.
+    """
+    if _refresher["pid"] == os.getpid():
+        return
+    _refresher["pid"] = os.getpid()
+    _refresher["worker_id"] = uuid.uuid4().hex
+    threading.Thread(target=_refresh_loop, daemon=True).start()
+
+
+def warm_cache():
+    parser = argparse.ArgumentParser("warm-cache")
+    parser.add_argument(
+        "round_nos", type=int, nargs="*", help="Round number(s), default current."
+    )
+    args = parser.parse_args()
+
+    rounds = {r.game: r for r in games_from_db()}
+    round_ids = [rounds[n].game_id for n in args.round_nos] or [active_round_id()]
+    for round_id in round_ids:
+        refresh_round(round_id)
+
+
+################
+# Live Updates #
+################
+
+# Browsers reconnect to the events stream this often, in milliseconds.
+EVENT_RETRY = 5000
+EVENT_RETRY_FINAL = 10 * 60 * 1000
+EVENT_BACKLOG = 50
+# How often the dashboard applies buffered events, in milliseconds.
+LIVE_INTERVAL = 2000
+
+
+def _figure_points(figure, holes):
+    """Each trace's y values at ``holes``, keyed hole then trace name."""
+    points = {hole: {} for hole in holes}
+    for trace in figure["data"]:
+        for x, y in zip(trace["x"], trace["y"]):
+            if x in points:
+                points[x][trace["name"]] = y
+    return points
+
+
+def _score_event(round_id, previous_version, version):
+    """The cells, totals and graph points changed since ``previous_version``."""
+    event = {"round_id": round_id, "version": version}
+    previous = cache.get(("matrix", round_id, previous_version))
+    if previous is None:
+        # Too old to diff against, the dashboard has to reload.
+        return {**event, "stale": True}
+
+    dense = scores_from_db(round_id).dense
+    round_day = round_wordle_day(round_id)
+    cells = dense.changed_cells(previous).tolist()
+    categories = dense.categories
+    cell_rows = []
+    for user_idx, hole_idx in cells:
+        username = dense.usernames[user_idx]
+        if dense.missing[user_idx, hole_idx]:
+            cell_rows.append([username, hole_idx + 1, "", None])
+            continue
+        display = wordlinator.utils.scores.present_score(
+            username,
+            int(dense.values[user_idx, hole_idx]),
+            dense.tweet_ids[user_idx, hole_idx],
+        )
+        category = wordlinator.utils.scores.SCORE_CATEGORIES[
+            categories[user_idx, hole_idx]
+        ]
+        cell_rows.append([username, hole_idx + 1, display, category])
+
+    users = sorted({u for u, _ in cells})
+    # The race is by each player's n-th played hole, and a changed score
+    # moves its player's running total from that point on.
+    played_before = (~dense.missing).cumsum(axis=1) - ~dense.missing
+    race_days = [int(played_before[u, h]) + 1 for u, h in cells]
+    race_holes = range(min(race_days), dense.values.shape[1] + 1) if cells else []
+    golf_scores = dense.golf_scores
+    stats_figure = get_line_graph(round_id).figure
+    return {
+        **event,
+        "hole": round_day.golf_hole.hole_no,
+        "scores": {dense.usernames[u]: int(golf_scores[u]) for u in users},
+        "cells": cell_rows,
+        # Whole, since players can drop out of the top or a score level
+        # out of a hole.
+        "leaderboard": get_leaderboard(round_id).data,
+        "stats": {
+            "data": stats_figure["data"],
+            "tickvals": stats_figure["layout"]["xaxis"]["tickvals"],
+        },
+        "race": _figure_points(line_race_graph(round_id).figure, race_holes),
+    }
+
+
+def publish_event(round_id, event):
+    """Queue ``event`` for the round's events stream, encoded once for all."""
+    seq = cache.incr(("event-seq", round_id), default=0)
+    data = json.dumps(event, separators=(",", ":"))
+    message = f"id: {seq}\nevent: scores\ndata: {data}\n\n"
+    with cache.transact():
+        events = cache.get(("events", round_id), default=[])
+        events = [*events, (seq, message)][-EVENT_BACKLOG:]
+        cache.set(("events", round_id), events, expire=DATA_EXPIRE)
+
+
+def round_events(round_id, since=None):
+    """Events stream body for a client that has seen up to event ``since``.
+
+    Each response is short lived, the browser reconnects after ``retry``
+    with its last event id, so an open dashboard never holds a worker.
+    """
+    retry = EVENT_RETRY_FINAL if round_is_complete(round_id) else EVENT_RETRY
+    latest = cache.get(("event-seq", round_id), default=0)
+    if since is None or since > latest:
+        # A new client starts from now.
+        return f"retry: {retry}\nid: {latest}\n\n"
+    events = cache.get(("events", round_id), default=[])
+    body = f"retry: {retry}\n\n"
+    if events and since < events[0][0] - 1:
+        stale = json.dumps({"round_id": round_id, "stale": True})
+        body += f"event: scores\ndata: {stale}\n\n"
+    return body + "".join(message for seq, message in events if seq > since)
 
 
 #############
 # App Setup #
 #############
 
-app.layout = dash.html.Div(
-    children=[
-        dash.html.H1("#WordleGolf", style={"textAlign": "center"}, id="title"),
-        dash.html.Div(
-            wordlinator.utils.web.get_date_dropdown(
-                games_from_db(), wordle_day=wordle_today()
+
+@functools.lru_cache(maxsize=1)
+def _layout(ttl_hash=None):
+    return dash.html.Div(
+        children=[
+            dash.html.H1("#WordleGolf", style={"textAlign": "center"}, id="title"),
+            dash.html.Div(
+                wordlinator.utils.web.get_date_dropdown(
+                    games_from_db(), wordle_day=wordle_today()
+                ),
+                id="round-selector",
+                style={"maxWidth": "300px"},
             ),
-            id="round-selector",
-            style={"maxWidth": "300px"},
-        ),
-        dash.dcc.Tabs(
-            id="main-tabs",
-            value="leaderboard",
-            children=[
-                dash.dcc.Tab(label="Leaderboard", value="leaderboard"),
-                dash.dcc.Tab(label="Statistics", value="statistics"),
-                dash.dcc.Tab(label="User Scores", value="user-scores"),
-            ],
-        ),
-        dash.dcc.Loading(dash.html.Div(id="tab-content"), id="tab-content-loading"),
-    ]
-)
+            dash.html.P(id="live-status"),
+            dash.dcc.Interval(id="live-interval", interval=LIVE_INTERVAL),
+            dash.dcc.Store(id="live-events"),
+            dash.dcc.Tabs(
+                id="main-tabs",
+                value="leaderboard",
+                children=[
+                    dash.dcc.Tab(label="Leaderboard", value="leaderboard"),
+                    dash.dcc.Tab(label="Statistics", value="statistics"),
+                    dash.dcc.Tab(label="User Scores", value="user-scores"),
+                    dash.dcc.Tab(label="Career", value="career"),
+                ],
+            ),
+            dash.dcc.Loading(dash.html.Div(id="tab-content"), id="tab-content-loading"),
+        ]
+    )
+
+
+def serve_layout():
+    return _layout(get_ttl_hash())
+
+
+# Built per page load rather than at import, so the round list stays current
+# and the layout doesn't query the database when the app is imported.
+app.layout = serve_layout
+
+
+# Rendered by background callbacks, in a separate process from the request.
+BACKGROUND_COMPONENTS = ("leaderboard-race", "stats-graph", "daily-stats")
+
+
+def _component(component_id):
+    loading = dash.dcc.Loading(
+        id=f"{component_id}-loading", children=dash.html.Div(id=component_id)
+    )
+    if component_id not in BACKGROUND_COMPONENTS:
+        return loading
+    progress = dash.html.P(id=f"{component_id}-progress")
+    return dash.html.Div([progress, loading])
+
+
+def _section(title, *component_ids):
+    return dash.html.Div(
+        [
+            dash.html.H2(title, style={"textAlign": "center"}),
+            *(_component(c) for c in component_ids),
+        ]
+    )
+
+
+# Tabs only lay out empty components, each is filled by its own callback
+# below, so they compute concurrently across workers.
+TAB_SECTIONS = {
+    "leaderboard": [
+        (f"Leaderboard - Top {LEADERBOARD_COUNT}", "leaderboard-race", "leaderboard")
+    ],
+    "user-scores": [("User Scores", "user-scores")],
+    "statistics": [("Score Graph", "stats-graph"), ("Daily Stats", "daily-stats")],
+    "career": [("Career Stats", "career-stats")],
+}
 
 
 @app.callback(
     dash.dependencies.Output("tab-content", "children"),
-    [
-        dash.dependencies.Input("main-tabs", "value"),
+    dash.dependencies.Input("main-tabs", "value"),
+)
+def render_tab(tab):
+    return [_section(*section) for section in TAB_SECTIONS.get(tab, [])]
+
+
+def _round_component(component_id, render):
+    app.callback(
+        dash.dependencies.Output(component_id, "children"),
         dash.dependencies.Input("round-selector-dropdown", "value"),
-    ],
+    )(render)
+
+
+_round_component("leaderboard", get_leaderboard)
+_round_component("user-scores", get_scores)
+
+
+def _background_component(component_id):
+    return app.long_callback(
+        dash.dependencies.Output(component_id, "children"),
+        dash.dependencies.Input("round-selector-dropdown", "value"),
+        manager=long_callback_manager,
+        progress=dash.dependencies.Output(f"{component_id}-progress", "children"),
+        progress_default="",
+    )
+
+
+# Results are cached by the function source, so each component needs its own.
+@_background_component("leaderboard-race")
+def render_line_race(set_progress, round_id):
+    set_progress("Loading scores...")
+    scores_from_db(round_id)
+    set_progress("Drawing the leaderboard race...")
+    return line_race_graph(round_id)
+
+
+@_background_component("stats-graph")
+def render_stats_graph(set_progress, round_id):
+    set_progress("Loading scores...")
+    scores_from_db(round_id)
+    set_progress("Drawing the score graph...")
+    return get_line_graph(round_id)
+
+
+@_background_component("daily-stats")
+def render_daily_stats(set_progress, round_id):
+    set_progress("Loading scores...")
+    scores_from_db(round_id)
+    set_progress("Tallying daily stats...")
+    return get_daily_stats(round_id)
+
+
+@app.callback(
+    dash.dependencies.Output("career-stats", "children"),
+    dash.dependencies.Input("main-tabs", "value"),
 )
-def render_tab(tab, round_id):
-    if tab == "leaderboard":
-        return [
-            dash.html.Div(
-                [
-                    dash.html.H2(
-                        f"Leaderboard - Top {LEADERBOARD_COUNT}",
-                        style={"textAlign": "center"},
-                    ),
-                    dash.dcc.Loading(
-                        id="leaderboard-race-loading",
-                        children=dash.html.Div(
-                            line_race_graph(round_id), id="leaderboard-race"
-                        ),
-                    ),
-                    dash.dcc.Loading(
-                        id="leaderboard-loading",
-                        children=dash.html.Div(
-                            get_leaderboard(round_id), id="leaderboard"
-                        ),
-                    ),
-                ]
-            ),
-        ]
-    elif tab == "user-scores":
-        return [
-            dash.html.Div(
-                [
-                    dash.html.H2("User Scores", style={"textAlign": "center"}),
-                    dash.dcc.Loading(
-                        id="user-scores-loading",
-                        children=dash.html.Div(get_scores(round_id), id="user-scores"),
-                    ),
-                ]
-            ),
-        ]
-    elif tab == "statistics":
-        return [
-            dash.html.Div(
-                [
-                    dash.html.H2("Score Graph", style={"textAlign": "center"}),
-                    dash.dcc.Loading(
-                        id="stats-graph-loading",
-                        children=dash.html.Div(
-                            get_line_graph(round_id), id="stats-graph"
-                        ),
-                    ),
-                ]
-            ),
-            dash.html.Div(
-                [
-                    dash.html.H2("Daily Stats", style={"textAlign": "center"}),
-                    dash.dcc.Loading(
-                        id="daily-stats-loading",
-                        children=dash.html.Div(
-                            get_daily_stats(round_id), id="daily-stats"
-                        ),
-                    ),
-                ]
-            ),
-        ]
+def render_career_stats(tab):
+    return get_career_stats()
 
 
 @app.callback(
     dash.dependencies.Output("user-scores-table", "data"),
+    dash.dependencies.Output("user-scores-table", "page_count"),
+    dash.dependencies.Input("user-scores-table", "page_current"),
+    dash.dependencies.Input("user-scores-table", "page_size"),
     dash.dependencies.Input("user-scores-table", "sort_by"),
-    dash.dependencies.State("user-scores-table", "data"),
+    dash.dependencies.Input("user-scores-table", "filter_query"),
+    dash.dependencies.State("round-selector-dropdown", "value"),
+    # The first page is rendered with the table.
+    prevent_initial_call=True,
 )
-def sort_scores(sort_by, data):
-    if not sort_by:
-        return data
-    sort_by = sort_by[0]
-
-    def _sort_val(entry):
-        col_id = sort_by["column_id"]
-        raw_val = entry.get(col_id)
-        if raw_val is None or raw_val == "":
-            return math.inf
-        if col_id == "Name":
-            return raw_val
-        if isinstance(raw_val, int) or raw_val.isdigit():
-            return int(raw_val)
-        match = VALUE_RE.match(raw_val).groupdict()["value"]
-        return int(match)
-
-    data = sorted(data, key=_sort_val, reverse=sort_by["direction"] == "desc")
-    return data
+def page_scores(page_current, page_size, sort_by, filter_query, round_id):
+    return page_score_rows(
+        round_id, page_current or 0, page_size or PAGE_SIZE, sort_by, filter_query
+    )
+
+
+app.clientside_callback(
+    dash.dependencies.ClientsideFunction(namespace="scores", function_name="sortRows"),
+    dash.dependencies.Output("user-scores-local-table", "data"),
+    dash.dependencies.Input("user-scores-local-table", "sort_by"),
+    dash.dependencies.Input("live-events", "data"),
+    dash.dependencies.State("user-scores-local-table", "data"),
+    prevent_initial_call=True,
+)
+
+
+app.clientside_callback(
+    dash.dependencies.ClientsideFunction(namespace="live", function_name="drain"),
+    dash.dependencies.Output("live-events", "data"),
+    dash.dependencies.Output("live-status", "children"),
+    dash.dependencies.Input("live-interval", "n_intervals"),
+    dash.dependencies.Input("round-selector-dropdown", "value"),
+)
+
+
+def _live_patch(component_id, prop, function_name):
+    app.clientside_callback(
+        dash.dependencies.ClientsideFunction(
+            namespace="live", function_name=function_name
+        ),
+        dash.dependencies.Output(component_id, prop),
+        dash.dependencies.Input("live-events", "data"),
+        dash.dependencies.State(component_id, prop),
+        prevent_initial_call=True,
+    )
+
+
+_live_patch("leaderboard-table", "data", "patchLeaderboard")
+_live_patch("stats-graph-figure", "figure", "patchStats")
+_live_patch("leaderboard-race-figure", "figure", "patchRace")
 
 
 server = app.server
 
 
-class GetLinkView(flask.views.View):
+@server.before_request
+def _ensure_refresher():
+    if not os.getenv("DISABLE_CACHE_REFRESH"):
+        start_refresher()
+
+
+###########
+# Metrics #
+###########
+
+# Each worker shares its metrics through the cache, so /metrics covers all.
+METRICS_FLUSH = 5
+METRICS_EXPIRE = DATA_EXPIRE
+# Log requests slower than this many seconds, unset to disable.
+SLOW_REQUEST_SECONDS = float(os.getenv("SLOW_REQUEST_SECONDS", 0))
+LRU_CACHES = {
+    "games": _games_from_db,
+    "wordle_today": _wordle_today,
+    "scores": _scores_from_db,
+    "final_scores": _final_scores,
+    "page_rows": _page_rows,
+    "page_order": _page_order,
+    "layout": _layout,
+}
+# Pids of the workers with a metrics snapshot in the cache.
+METRICS_WORKERS = ("metrics-workers",)
+_metrics_flushed = {"time": 0.0}
+
+
+def _record_query(sql, elapsed):
+    metrics.inc("wordlinator_db_queries_total")
+    metrics.inc("wordlinator_db_query_seconds_total", elapsed)
+    if flask.has_request_context():
+        flask.g.db_queries = flask.g.get("db_queries", 0) + 1
+        flask.g.db_seconds = flask.g.get("db_seconds", 0.0) + elapsed
+
+
+db.WordleDatabase.timing_hooks.append(_record_query)
+
+
+def _flush_metrics(force=False):
+    now = time.time()
+    if not force and now - _metrics_flushed["time"] < METRICS_FLUSH:
+        return
+    _metrics_flushed["time"] = now
+    for name, cached in LRU_CACHES.items():
+        info = cached.cache_info()
+        metrics.set("wordlinator_lru_cache_hits_total", info.hits, cache=name)
+        metrics.set("wordlinator_lru_cache_misses_total", info.misses, cache=name)
+    pid = os.getpid()
+    cache.set(("metrics", pid), metrics.snapshot(), expire=METRICS_EXPIRE)
+    if pid not in cache.get(METRICS_WORKERS, default=set()):
+        _update_metrics_workers(lambda pids: pids | {pid})
+
+
+def _update_metrics_workers(update):
+    with cache.transact():
+        cache.set(METRICS_WORKERS, update(cache.get(METRICS_WORKERS, default=set())))
+
+
+def forget_worker_metrics(pid):
+    """Drop an exited worker's metrics, called from gunicorn's worker_exit."""
+    _update_metrics_workers(lambda pids: pids - {pid})
+    cache.delete(("metrics", pid))
+
+
+def _callback_label(output):
+    # Clients say which output they want, only label the ones registered here.
+    return output if output in app.callback_map else "other"
+
+
+@server.before_request
+def _start_request_timer():
+    flask.g.request_start = time.perf_counter()
+
+
+@server.after_request
+def _record_request(response):
+    elapsed = time.perf_counter() - flask.g.get("request_start", time.perf_counter())
+    request = flask.request
+    handler = request.endpoint or "unmatched"
+    size = response.content_length or 0
+    metrics.observe("wordlinator_request_seconds", elapsed, endpoint=handler)
+    if request.path.endswith("_dash-update-component"):
+        # One endpoint serves every callback, label them by their output.
+        handler = _callback_label((request.get_json(silent=True) or {}).get("output"))
+        metrics.observe("wordlinator_callback_seconds", elapsed, callback=handler)
+
+    queries = flask.g.get("db_queries", 0)
+    db_seconds = flask.g.get("db_seconds", 0.0)
+    size_buckets = wordlinator.utils.metrics.SIZE_BUCKETS
+    count_buckets = wordlinator.utils.metrics.COUNT_BUCKETS
+    metrics.observe(
+        "wordlinator_response_bytes", size, buckets=size_buckets, handler=handler
+    )
+    metrics.observe(
+        "wordlinator_request_db_queries",
+        queries,
+        buckets=count_buckets,
+        handler=handler,
+    )
+    metrics.observe("wordlinator_request_db_seconds", db_seconds, handler=handler)
+
+    if SLOW_REQUEST_SECONDS and elapsed >= SLOW_REQUEST_SECONDS:
+        server.logger.warning(
+            "Slow request %s: %.3fs, %d queries in %.3fs, %d bytes",
+            handler,
+            elapsed,
+            queries,
+            db_seconds,
+            size,
+        )
+    _flush_metrics()
+    return response
+
+
+class MetricsView(flask.views.View):
+    """Every worker's metrics in the Prometheus text format."""
+
     methods = ["GET"]
 
     def dispatch_request(self):
-        today = wordle_today()
-        missing_users = db.WordleDb().get_users_without_score(
-            today.golf_hole.game_no, today.golf_hole.hole_no
+        _flush_metrics(force=True)
+        pids = cache.get(METRICS_WORKERS, default=set())
+        snapshots = {pid: cache.get(("metrics", pid)) for pid in pids}
+        expired = {pid for pid, snapshot in snapshots.items() if snapshot is None}
+        if expired:
+            # Workers killed before they could clean up after themselves.
+            _update_metrics_workers(lambda pids: pids - expired)
+        merged = wordlinator.utils.metrics.merge(s for s in snapshots.values() if s)
+        return flask.Response(
+            wordlinator.utils.metrics.render(merged),
+            mimetype="text/plain; version=0.0.4",
         )
-        link = wordlinator.twitter.TwitterClient.full_notify_link(missing_users)
-        return flask.redirect(link)
+
+
+server.add_url_rule("/metrics", view_func=MetricsView.as_view("metrics"))
+
+
+class GetLinkView(flask.views.View):
+    """Redirect to a tweet mentioning today's missing players.
+
+    ``?part=N`` picks the Nth of the tweet-sized messages instead, and
+    ``?format=json`` returns the names and every link.
+    """
+
+    methods = ["GET"]
+
+    def dispatch_request(self):
+        missing = missing_players()
+        if flask.request.args.get("format") == "json":
+            return flask.jsonify(missing)
+        part = flask.request.args.get("part", type=int)
+        if part is None:
+            return flask.redirect(missing["link"])
+        if not 1 <= part <= len(missing["parts"]):
+            flask.abort(404)
+        return flask.redirect(missing["parts"][part - 1])
 
 
 server.add_url_rule("/tweet_link", view_func=GetLinkView.as_view("tweet_link"))
 
 
+###############
+# API Helpers #
+###############
+
+
+def round_info(game):
+    return {
+        "round_id": game.game_id,
+        "round": game.game,
+        "start_date": game.start_date.isoformat(),
+        "end_date": game.end_date.isoformat(),
+        "complete": round_is_complete(game.game_id),
+    }
+
+
+def _api_leaderboard(round_id):
+    user_scores = scores_from_db(round_id).golf_scores()
+    board = sorted(user_scores.items(), key=lambda u: u[1])
+    rows = []
+    for idx, (username, score) in enumerate(board):
+        # Tied players share the better rank.
+        rank = rows[-1]["rank"] if rows and rows[-1]["score"] == score else idx + 1
+        rows.append({"rank": rank, "name": username, "score": score})
+    return rows
+
+
+def _api_scores(round_id):
+    dense = scores_from_db(round_id).dense
+    hole_no = round_wordle_day(round_id).golf_hole.hole_no
+    values = dense.values[:, :hole_no].tolist()
+    missing = dense.missing[:, :hole_no].tolist()
+    return [
+        {
+            "name": username,
+            "score": score,
+            "holes": [
+                None if hole_missing else value
+                for value, hole_missing in zip(values[idx], missing[idx])
+            ],
+        }
+        for idx, (username, score) in enumerate(
+            zip(dense.usernames, dense.golf_scores.tolist())
+        )
+    ]
+
+
+def _api_projection(round_id):
+    # Simulated once per data version, as the matrix is.
+    projection = wordlinator.utils.projection.project(
+        scores_from_db(round_id), round_wordle_day(round_id).golf_hole.hole_no
+    )
+    return sorted(projection.rows(), key=lambda r: r["Expected Finish"])
+
+
+API_RENDERERS = {
+    "leaderboard": _api_leaderboard,
+    "scores": _api_scores,
+    "stats": get_stats_rows,
+    "projection": _api_projection,
+}
+
+
+def encode_json(data):
+    body = json.dumps(data, separators=(",", ":")).encode()
+    return {"body": body, "gzip": gzip.compress(body)}
+
+
+def _api_name(name, round_id):
+    # Score rows are padded out to the current hole, so they change daily.
+    return f"api-{name}-{round_wordle_day(round_id).wordle_no}"
+
+
+def api_payload(name, round_id):
+    """A round's API payload, encoded once and shared until its data changes."""
+    return round_payload(
+        _api_name(name, round_id),
+        round_id,
+        lambda: encode_json(API_RENDERERS[name](round_id)),
+    )
+
+
+def _json_response(payload, etag, max_age):
+    request = flask.request
+    if etag in request.if_none_match:
+        response = flask.Response(status=304)
+    elif "gzip" in request.accept_encodings:
+        response = flask.Response(payload["gzip"], mimetype="application/json")
+        response.headers["Content-Encoding"] = "gzip"
+    else:
+        response = flask.Response(payload["body"], mimetype="application/json")
+    response.set_etag(etag)
+    response.headers["Vary"] = "Accept-Encoding"
+    response.cache_control.public = True
+    response.cache_control.max_age = max_age
+    return response
+
+
+class RoundsApiView(flask.views.View):
+    methods = ["GET"]
+
+    def dispatch_request(self):
+        payload = shared_get(
+            ("api-rounds", get_ttl_hash()),
+            lambda: encode_json([round_info(g) for g in games_from_db()]),
+            expire=TTL_TIME,
+        )
+        etag = hashlib.md5(payload["body"]).hexdigest()
+        return _json_response(payload, etag, TTL_TIME)
+
+
+class RoundApiView(flask.views.View):
+    """A JSON view of one round, tagged with the round's data version."""
+
+    methods = ["GET"]
+
+    def __init__(self, name):
+        self.name = name
+
+    def dispatch_request(self, round_id):
+        if not any(g.game_id == round_id for g in games_from_db()):
+            flask.abort(404)
+        etag = f"{_api_name(self.name, round_id)}-{round_id}-{round_version(round_id)}"
+        if etag in flask.request.if_none_match:
+            # Skip loading the payload when the client is up to date.
+            payload = None
+        else:
+            payload = api_payload(self.name, round_id)
+        max_age = API_FINAL_MAX_AGE if round_is_complete(round_id) else TTL_TIME
+        return _json_response(payload, etag, max_age)
+
+
+class RoundEventsView(flask.views.View):
+    methods = ["GET"]
+
+    def dispatch_request(self, round_id):
+        since = flask.request.headers.get("Last-Event-ID", type=int)
+        return flask.Response(
+            round_events(round_id, since),
+            mimetype="text/event-stream",
+            headers={"Cache-Control": "no-cache"},
+        )
+
+
+server.add_url_rule("/api/rounds", view_func=RoundsApiView.as_view("api_rounds"))
+server.add_url_rule(
+    "/api/rounds/<int:round_id>/events",
+    view_func=RoundEventsView.as_view("api_events"),
+)
+for _name in API_RENDERERS:
+    server.add_url_rule(
+        f"/api/rounds/<int:round_id>/{_name}",
+        view_func=RoundApiView.as_view(f"api_{_name}", _name),
+    )
+
+
 def serve(debug=True):
     app.run(debug=debug)
 
@@ -0,0 +1,189 @@
+// Live score updates: one EventSource per open round buffers the events
+// from /api/rounds/<id>/events, and the live-interval callback hands them
+// to the patch callbacks below, which edit the components in place.
+(function () {
+    const state = { roundId: null, source: null, events: [], stale: false };
+
+    const watch = function (roundId) {
+        if (state.roundId === roundId) {
+            return;
+        }
+        if (state.source) {
+            state.source.close();
+        }
+        state.roundId = roundId;
+        state.events = [];
+        state.stale = false;
+        state.source = new EventSource(`/api/rounds/${roundId}/events`);
+        state.source.addEventListener("scores", function (message) {
+            const event = JSON.parse(message.data);
+            if (event.round_id !== state.roundId) {
+                return;
+            }
+            if (event.stale) {
+                state.stale = true;
+            } else {
+                state.events.push(event);
+            }
+        });
+    };
+
+    const copy = function (value) {
+        return JSON.parse(JSON.stringify(value));
+    };
+
+    const eventsFor = function (live) {
+        return live && live.events ? live.events : [];
+    };
+
+    // Set the y value at x on a trace, adding the point in x order.
+    const setPoint = function (trace, x, y) {
+        const idx = trace.x.indexOf(x);
+        if (idx >= 0) {
+            trace.y[idx] = y;
+            return;
+        }
+        let at = trace.x.findIndex(function (other) { return other > x; });
+        at = at < 0 ? trace.x.length : at;
+        trace.x.splice(at, 0, x);
+        trace.y.splice(at, 0, y);
+    };
+
+    const removePoint = function (trace, x) {
+        const idx = trace.x.indexOf(x);
+        if (idx >= 0) {
+            trace.x.splice(idx, 1);
+            trace.y.splice(idx, 1);
+        }
+    };
+
+    const patchRows = function (live, rows) {
+        const patched = rows.slice();
+        const index = {};
+        patched.forEach(function (row, idx) { index[row.Name] = idx; });
+        eventsFor(live).forEach(function (event) {
+            event.cells.forEach(function (cell) {
+                const [name, hole, display, category] = cell;
+                if (!(name in index)) {
+                    // Padded out to the current hole, like user_rows.
+                    const row = { Name: name };
+                    for (let h = 1; h <= event.hole; h++) {
+                        row[h] = "";
+                    }
+                    index[name] = patched.length;
+                    patched.push(row);
+                }
+                const row = Object.assign({}, patched[index[name]]);
+                row[hole] = display;
+                if (category) {
+                    row[`${hole}_c`] = category;
+                } else {
+                    delete row[`${hole}_c`];
+                }
+                patched[index[name]] = row;
+            });
+            Object.entries(event.scores).forEach(function ([name, score]) {
+                if (name in index) {
+                    patched[index[name]] = Object.assign({}, patched[index[name]], { Score: score });
+                }
+            });
+        });
+        return patched;
+    };
+
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        live: {
+            drain: function (nIntervals, roundId) {
+                const noUpdate = window.dash_clientside.no_update;
+                if (roundId === null || roundId === undefined) {
+                    return [noUpdate, noUpdate];
+                }
+                if (state.roundId !== roundId) {
+                    watch(roundId);
+                    return [{ round_id: roundId, events: [] }, ""];
+                }
+                const status = state.stale ? "New scores are in, reload the page to see them." : noUpdate;
+                if (!state.events.length) {
+                    return [noUpdate, status];
+                }
+                const events = state.events;
+                state.events = [];
+                return [{ round_id: roundId, events: events }, status];
+            },
+
+            patchRows: patchRows,
+
+            patchLeaderboard: function (live, rows) {
+                const events = eventsFor(live);
+                if (!rows || !events.length) {
+                    return window.dash_clientside.no_update;
+                }
+                return events[events.length - 1].leaderboard;
+            },
+
+            patchStats: function (live, figure) {
+                const events = eventsFor(live);
+                if (!figure || !events.length) {
+                    return window.dash_clientside.no_update;
+                }
+                const stats = events[events.length - 1].stats;
+                const patched = copy(figure);
+                patched.data = stats.data;
+                patched.layout.xaxis.tickvals = stats.tickvals;
+                return patched;
+            },
+
+            patchRace: function (live, figure) {
+                const events = eventsFor(live);
+                if (!figure || !events.length) {
+                    return window.dash_clientside.no_update;
+                }
+                const patched = copy(figure);
+                events.forEach(function (event) {
+                    Object.entries(event.race).forEach(function ([hole, ranks]) {
+                        hole = Number(hole);
+                        const seen = new Set();
+                        patched.data.forEach(function (trace) {
+                            if (trace.name in ranks) {
+                                setPoint(trace, hole, ranks[trace.name]);
+                                seen.add(trace.name);
+                            } else {
+                                removePoint(trace, hole);
+                            }
+                        });
+                        Object.entries(ranks).forEach(function ([name, rank]) {
+                            if (!seen.has(name)) {
+                                patched.data.push({
+                                    type: "scatter",
+                                    name: name,
+                                    mode: "lines+markers",
+                                    x: [hole],
+                                    y: [rank],
+                                });
+                            }
+                        });
+                    });
+
+                    // Label players whose line ends on the current hole, as
+                    // line_race_graph does.
+                    const names = {};
+                    patched.data.forEach(function (trace) {
+                        const last = trace.x.length - 1;
+                        if (last >= 0 && trace.x[last] === event.hole) {
+                            const y = trace.y[last];
+                            (names[y] = names[y] || []).push(trace.name);
+                        }
+                    });
+                    const annotations = (patched.layout.annotations || []).filter(
+                        function (a) { return a.x !== event.hole; }
+                    );
+                    Object.entries(names).forEach(function ([y, group]) {
+                        annotations.push({ x: event.hole, y: Number(y), text: group.join(", ") });
+                    });
+                    patched.layout.annotations = annotations;
+                });
+                return patched;
+            },
+        },
+    });
+})();
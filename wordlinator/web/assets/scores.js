@@ -0,0 +1,57 @@
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    scores: {
+        // Sort the user-scores rows in the browser, matching page_score_rows:
+        // names by string, everything else numerically with blanks last.
+        // Live score events are patched in first, then the rows re-sorted.
+        sortRows: function (sortBy, live, rows) {
+            if (!rows) {
+                return window.dash_clientside.no_update;
+            }
+            const triggered = window.dash_clientside.callback_context.triggered;
+            const patched = triggered.some(function (t) {
+                return t.prop_id === "live-events.data";
+            });
+            if (patched) {
+                rows = window.dash_clientside.live.patchRows(live, rows);
+            }
+            if (!sortBy || !sortBy.length) {
+                return patched ? rows : window.dash_clientside.no_update;
+            }
+            const col = sortBy[0].column_id;
+            const desc = sortBy[0].direction === "desc";
+
+            const sortKey = function (row) {
+                const cell = row[col];
+                if (col === "Name") {
+                    return cell;
+                }
+                if (cell === undefined || cell === null || cell === "") {
+                    return null;
+                }
+                // Linked scores look like "[4](https://twitter.com/...)".
+                const match = String(cell).match(/^\[?(-?\d+)/);
+                return match ? Number(match[1]) : null;
+            };
+
+            const keyed = rows.map(function (row, idx) {
+                return { key: sortKey(row), idx: idx };
+            });
+            const played = keyed.filter(function (k) { return k.key !== null; });
+            const blanks = keyed.filter(function (k) { return k.key === null; });
+
+            played.sort(function (a, b) {
+                if (a.key < b.key) {
+                    return -1;
+                }
+                if (a.key > b.key) {
+                    return 1;
+                }
+                return a.idx - b.idx;
+            });
+            if (desc) {
+                played.reverse();
+            }
+            return played.concat(blanks).map(function (k) { return rows[k.idx]; });
+        },
+    },
+});
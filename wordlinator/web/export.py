@@ -0,0 +1,221 @@
+"""Static snapshots of each round's pages, for serving history from disk.
+
+Each round is written to ``<out>/round-<n>/`` as an ``index.html`` page plus
+the API payloads (with ``.gz`` copies for ``gzip_static``) and figures as
+JSON. ``manifest.json`` records the data version each round was exported
+at, so later runs only rewrite rounds whose data has changed.
+"""
+import argparse
+import html
+import json
+import os
+import pathlib
+import re
+import shutil
+import tempfile
+
+import multiprocess
+import plotly.io
+import plotly.offline
+
+import wordlinator.utils.scores
+import wordlinator.utils.web
+import wordlinator.web as web
+
+MANIFEST = "manifest.json"
+PLOTLY_JS = "plotly.min.js"
+
+PAGE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<script src="{plotly_js}"></script>
+<style>
+body {{ font-family: sans-serif; text-align: center; }}
+table {{ border-collapse: collapse; margin: auto; }}
+th, td {{ padding: 2px 8px; border-bottom: 1px solid #ddd; }}
+</style>
+</head>
+<body>
+<h1>{title}</h1>
+{body}
+</body>
+</html>
+"""
+
+_LINK = re.compile(r"^\[(?P<text>.*)\]\((?P<href>.*)\)$")
+
+
+def _cell(value, color=None):
+    text = html.escape(f"{value}")
+    match = _LINK.match(f"{value}")
+    if match:
+        href, text = (html.escape(match[k]) for k in ("href", "text"))
+        text = f'<a href="{href}">{text}</a>'
+    style = f' style="background-color: {color}"' if color else ""
+    return f"<td{style}>{text}</td>"
+
+
+def _table(columns, rows, colors=None):
+    head = "".join(f"<th>{html.escape(c)}</th>" for c in columns)
+    body = []
+    for row in rows:
+        cells = "".join(
+            _cell(row.get(c, ""), colors(row, c) if colors else None) for c in columns
+        )
+        body.append(f"<tr>{cells}</tr>")
+    return f"<table><tr>{head}</tr>{''.join(body)}</table>"
+
+
+def _score_color(row, column):
+    category = row.get(wordlinator.utils.scores.category_id(column))
+    return wordlinator.utils.web.CATEGORY_COLORS.get(category)
+
+
+def _figure_html(figure):
+    return plotly.io.to_html(
+        figure, full_html=False, include_plotlyjs=False, validate=False
+    )
+
+
+def _section(title, content):
+    return f"<h2>{html.escape(title)}</h2>\n{content}"
+
+
+def _round_page(game, figures):
+    round_id = game.game_id
+    holes = [
+        f"{i}" for i in range(1, web.round_wordle_day(round_id).golf_hole.hole_no + 1)
+    ]
+    # Keyed by hole number, as user_rows builds them.
+    score_rows = [
+        {f"{k}": v for k, v in row.items()} for row in web.get_score_rows(round_id)
+    ]
+    body = "\n".join(
+        [
+            _section(
+                "Leaderboard",
+                _table(["Name", "Score"], web.get_leaderboard(round_id).data),
+            ),
+            _section("Race", _figure_html(figures["race"])),
+            _section("Statistics", _figure_html(figures["graph"])),
+            _section(
+                "Daily Stats", _table(["Score", *holes], web.get_stats_rows(round_id))
+            ),
+            _section(
+                "User Scores",
+                _table(["Name", "Score", *holes], score_rows, colors=_score_color),
+            ),
+        ]
+    )
+    title = (
+        f"#WordleGolf Round {game.game} "
+        f"({game.start_date.isoformat()} to {game.end_date.isoformat()})"
+    )
+    return PAGE.format(title=title, plotly_js=f"../{PLOTLY_JS}", body=body)
+
+
+def _index_page(games):
+    items = "".join(
+        f'<li><a href="round-{g.game}/index.html">Round {g.game}</a> '
+        f"({g.start_date.isoformat()} to {g.end_date.isoformat()})</li>"
+        for g in sorted(games, key=lambda g: g.game, reverse=True)
+    )
+    return PAGE.format(
+        title="#WordleGolf Rounds", plotly_js=PLOTLY_JS, body=f"<ul>{items}</ul>"
+    )
+
+
+def _write_json(path, payload):
+    path.write_bytes(payload["body"])
+    path.with_name(f"{path.name}.gz").write_bytes(payload["gzip"])
+
+
+def _export_round(out, game, version):
+    """Write one round's bundle, swapping it in whole once it is complete."""
+    round_id = game.game_id
+    staging = pathlib.Path(tempfile.mkdtemp(prefix=".round-", dir=out))
+    try:
+        # Every payload is rendered from the version the export was planned for.
+        with web.pinned_version(round_id, version):
+            figures = {
+                "race": web.line_race_graph(round_id).figure,
+                "graph": web.get_line_graph(round_id).figure,
+            }
+            for name in web.API_RENDERERS:
+                _write_json(staging / f"{name}.json", web.api_payload(name, round_id))
+            for name, figure in figures.items():
+                _write_json(staging / f"{name}.json", web.encode_json(figure))
+            (staging / "index.html").write_text(_round_page(game, figures))
+
+        target = out / f"round-{game.game}"
+        if target.exists():
+            shutil.rmtree(target)
+        staging.chmod(0o755)
+        staging.rename(target)
+    finally:
+        # Gone once swapped in, left over only if the export failed.
+        shutil.rmtree(staging, ignore_errors=True)
+    return game.game
+
+
+def _export_key(game, version):
+    # Score rows are padded out to the current hole, so they change daily.
+    return f"{version}-{web.round_wordle_day(game.game_id).wordle_no}"
+
+
+def export_static():
+    parser = argparse.ArgumentParser("export-static")
+    parser.add_argument(
+        "round_nos", type=int, nargs="*", help="Round number(s), default all."
+    )
+    parser.add_argument(
+        "--out", type=pathlib.Path, default=pathlib.Path("static"), help="Output dir."
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=os.cpu_count(),
+        help="Rounds to export in parallel.",
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="Re-export rounds that are unchanged."
+    )
+    args = parser.parse_args()
+
+    games = web.games_from_db()
+    rounds = {g.game: g for g in games}
+    for round_no in args.round_nos:
+        if round_no not in rounds:
+            raise ValueError(f"Round {round_no} does not exist")
+
+    out = args.out
+    out.mkdir(parents=True, exist_ok=True)
+    manifest_path = out / MANIFEST
+    manifest = json.loads(manifest_path.read_text()) if manifest_path.exists() else {}
+
+    pending, keys = [], {}
+    for round_no in args.round_nos or sorted(rounds):
+        game = rounds[round_no]
+        version = web.round_version(game.game_id)
+        keys[f"{round_no}"] = key = _export_key(game, version)
+        exported = (out / f"round-{round_no}" / "index.html").exists()
+        if args.force or not exported or manifest.get(f"{round_no}") != key:
+            pending.append((out, game, version))
+
+    if len(pending) > 1 and args.processes and args.processes > 1:
+        with multiprocess.Pool(min(args.processes, len(pending))) as pool:
+            results = pool.starmap(_export_round, pending)
+    else:
+        results = [_export_round(*p) for p in pending]
+
+    if not (out / PLOTLY_JS).exists():
+        (out / PLOTLY_JS).write_text(plotly.offline.get_plotlyjs())
+    (out / "index.html").write_text(_index_page(games))
+    _write_json(
+        out / "rounds.json", web.encode_json([web.round_info(g) for g in games])
+    )
+
+    manifest.update({f"{round_no}": keys[f"{round_no}"] for round_no in results})
+    manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True))